@@ -1,17 +1,18 @@
 """Module of main branch and cut."""
-import cProfile
-import io
 import json
-import pstats
+from pathlib import Path
+import os
 
 from src.instance.instance import Instance
-from src.instance.scenario import Scenario
 from src.model.branch_and_cut import Branch_and_Cut
 from src.utils import LOGGER as logger
+from src.utils import configure_logging
 
 if __name__ == "__main__":
+    configure_logging()
     # (1) Generate instance
-    folder_path = "./data/results/byc/"
+    folder_path = Path("./data/results/byc/")
+    folder_path.mkdir(parents=True, exist_ok=True)
     logger.info("[MAIN BRANCH AND CUT] Generating instances")
 
     instance_to_solve: Instance = Instance(
@@ -29,31 +30,34 @@ if __name__ == "__main__":
     instance_to_solve.scenarios = {"expected": scenario}
 
     # (2) Create model
-    logger.info(
-        f"[MAIN BRANCH AND CUT] Instance generated - instance_to_solve {instance_to_solve}"
-    )
+    logger.info("[MAIN BRANCH AND CUT] Instance generated - instance_to_solve %s", instance_to_solve)
 
     solver = Branch_and_Cut(instance_to_solve)
-    pr = cProfile.Profile()
-    pr.enable()
-
-    solver.solve(max_run_time=60, warm_start=False)
 
-    pr.disable()
-    s = io.StringIO()
-    ps = pstats.Stats(pr, stream=s)
-    ps.strip_dirs().sort_stats("cumulative").print_stats(10)
+    # profiling instruments every Python frame of the callback-heavy solve,
+    # so only enable it on demand
+    if os.environ.get("PROFILE"):
+        import cProfile
+        import io
+        import pstats
 
-    print(f"Profile: {s.getvalue()}")
+        with cProfile.Profile() as pr:
+            solver.solve(max_run_time=60, warm_start=False)
+        s = io.StringIO()
+        ps = pstats.Stats(pr, stream=s)
+        ps.strip_dirs().sort_stats("cumulative").print_stats(10)
+        print(f"Profile: {s.getvalue()}")
+    else:
+        solver.solve(max_run_time=60, warm_start=False)
 
     # (3) Save results:
     results = solver.get_metrics_evaluation()
 
     path_file_output = (
-        folder_path + f"branch_and_cut_{instance_to_solve.id_instance}.json"
+        folder_path / f"branch_and_cut_{instance_to_solve.id_instance}.json"
     )
     with open(path_file_output, "w") as file:
-        file.write(json.dumps(results, indent=4))
+        json.dump(results, file, separators=(",", ":"))
     print(f"Results saved in {path_file_output}")
 
     print("-----------------------------------")
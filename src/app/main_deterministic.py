@@ -1,17 +1,21 @@
 """Main module for the SAA application."""
 import json
-import logging
+from pathlib import Path
 from datetime import date
 
 from src.instance.instance import Instance
 from src.model.deterministic import FlexibilityModel
 from src.utils import LOGGER as logger
+from src.utils import configure_logging
+from src.utils import QuietLogging
 
 if __name__ == "__main__":
+    configure_logging()
     logger.info("[MAIN DETERMINISTIC] Starting deterministic model")
 
     # (1) Generate instance:
-    FOLDER_PATH = "./data/results/deterministic/"
+    FOLDER_PATH = Path("./data/results/deterministic/")
+    FOLDER_PATH.mkdir(parents=True, exist_ok=True)
     logger.info("[MAIN DETERMINISTIC] Generating instances")
     instance_to_solve: Instance = Instance(
         id_instance=f"expected_normal_{date.today()}",  # id_instance
@@ -28,26 +32,23 @@ if __name__ == "__main__":
     instance_to_solve.scenarios = {"expected": scenario}
 
     # (2) Create model:
-    logger.info(
-        f"[MAIN DETERMINISTIC] Instance generated - instance_to_solve \n{instance_to_solve}"
-    )
+    logger.info("[MAIN DETERMINISTIC] Instance generated - instance_to_solve \n%s", instance_to_solve)
     model = FlexibilityModel(instance_to_solve)
     model.build()
     params = {
         "TimeLimit": 120,
         "MIPGap": 0.005,
     }
-    logger.info(f"[MAIN DETERMINISTIC] Model run with params {params} - solving...")
+    logger.info("[MAIN DETERMINISTIC] Model run with params %s - solving...", params)
     # (3) Solve the model:
-    logger.disabled = True
-    logging.disable(logging.CRITICAL)
-    model.set_params(params)
-    model.solve()
-    logger.disabled = False
-    logging.disable(logging.NOTSET)
+    with QuietLogging():
+        model.set_params(params)
+        model.solve()
 
     # (3) Save results:
-    Y_solution = {str(keys): value.X for keys, value in model.model._Y.items()}
+    Y_vars = model.model._Y
+    Y_values = model.model.getAttr("X", list(Y_vars.values()))
+    Y_solution = dict(zip(map(str, Y_vars.keys()), Y_values))
     Y_solution["objective"] = model.objective.getValue()
     Y_solution[
         "cost_installation_satellites"
@@ -60,10 +61,10 @@ if __name__ == "__main__":
     Y_solution["scenarios"] = instance_to_solve.get_info()
 
     path_file_output = (
-        FOLDER_PATH + f"deterministic_{instance_to_solve.id_instance}.json"
+        FOLDER_PATH / f"deterministic_{instance_to_solve.id_instance}.json"
     )
     with open(path_file_output, "w") as file:
-        file.write(json.dumps(Y_solution, indent=4))
+        json.dump(Y_solution, file, separators=(",", ":"))
     print(f"Results saved in {path_file_output}")
 
     print("-----------------------------------")
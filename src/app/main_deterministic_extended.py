@@ -1,15 +1,18 @@
 """Main module for the SAA application."""
 import json
-import logging
+from pathlib import Path
 
 from src.instance.experiment import Experiment
-from src.instance.instance import Instance  # type: ignore
 from src.model.deterministic_extended import FlexibilityModelExtended
 from src.utils import LOGGER as logger
+from src.utils import configure_logging
+from src.utils import QuietLogging
 
 if __name__ == "__main__":
+    configure_logging()
     # (1) Generate instance:
-    folder_path = "./data/results/deterministic_extended/"
+    folder_path = Path("./data/results/deterministic_extended/")
+    folder_path.mkdir(parents=True, exist_ok=True)
 
     logger.info("[MAIN DETERMINISTIC EXTENDED] Starting deterministic model")
     logger.info("[MAIN DETERMINISTIC EXTENDED] Generating instances")
@@ -21,21 +24,20 @@ if __name__ == "__main__":
     # (1.2) Select instance to solve:
     for i, experiment in enumerate(instance_generated):
         id_experiment = (1 + i) * 100
-        logger.info(f"[MAIN DETERMINISTIC EXTENDED] Experiment {id_experiment} started")
+        logger.info("[MAIN DETERMINISTIC EXTENDED] Experiment %s started", id_experiment)
         for id_instance, instance in experiment["instances_train"].items():
-            logger.info(f"[MAIN DETERMINISTIC EXTENDED] Instance to solve \n{instance}")
+            logger.info("[MAIN DETERMINISTIC EXTENDED] Instance to solve \n%s", instance)
             # (2) Create model:
 
-            logger.disabled = True
-            logging.disable(logging.CRITICAL)
             solver = FlexibilityModelExtended(instance)
             solver.build()
-            solver.solve()
-            logger.disabled = False
-            logging.disable(logging.NOTSET)
+            with QuietLogging():
+                solver.solve()
 
             # (3) Save results:
-            Y_solution = {str(keys): value.X for keys, value in solver.model._Y.items()}
+            Y_vars = solver.model._Y
+            Y_values = solver.model.getAttr("X", list(Y_vars.values()))
+            Y_solution = dict(zip(map(str, Y_vars.keys()), Y_values))
             Y_solution["objective"] = solver.objective.getValue()
             Y_solution[
                 "cost_installation_satellites"
@@ -50,10 +52,10 @@ if __name__ == "__main__":
             Y_solution["scenarios"] = instance.get_info()
 
             path_file_output = (
-                folder_path + f"deterministic_{instance.id_instance}.json"
+                folder_path / f"deterministic_{instance.id_instance}.json"
             )
             with open(path_file_output, "w") as file:
-                file.write(json.dumps(Y_solution, indent=4))
+                json.dump(Y_solution, file, separators=(",", ":"))
             print(f"Results saved in {path_file_output}")
 
             print("-----------------------------------")
@@ -1,38 +1,46 @@
 """Module of instance generator."""
 import json
-import logging
+import os
+from pathlib import Path
 
 from src.instance.instance import Instance
 from src.model.deterministic_extended import FlexibilityModelExtended
 from src.utils import LOGGER as logger
+from src.utils import QuietLogging
 
 
 class Main:
+    # fsync the aggregate results log every N appended results
+    FSYNC_EVERY = 10
+
     def __init__(self, folder_path: str):
-        self.folder_path = folder_path
+        # create the output folder up front so a missing directory cannot
+        # discard the results of a long solve at write time
+        self.folder_path = Path(folder_path)
+        self.folder_path.mkdir(parents=True, exist_ok=True)
+        # one append-only log for all instances instead of a file per
+        # instance, so long loops pay one sequential write per result
+        self.path_results = self.folder_path / "all_results.jsonl"
+        self._results_file = open(self.path_results, "a")
+        self._results_written = 0
 
     def solve(self, instance: Instance, run_time: int):
         self.instance: Instance = instance
-        logger.info(
-            f"[MAIN DETERMINISTIC EXTENDED] Experiment {self.instance.id_instance} started"
-        )
-        logger.info(
-            f"[MAIN DETERMINISTIC EXTENDED] Instance to solve \n{self.instance}"
-        )
+        logger.info("[MAIN DETERMINISTIC EXTENDED] Experiment %s started", self.instance.id_instance)
+        logger.info("[MAIN DETERMINISTIC EXTENDED] Instance to solve \n%s", self.instance)
         # (2) Create model:
 
-        logger.disabled = True
-        logging.disable(logging.CRITICAL)
         solver = FlexibilityModelExtended(self.instance)
         solver.build()
-        params_config = {"TimeLimit": run_time, "MIPGap": 0.0005}
+        params_config = {"TimeLimit": run_time, "MIPGap": 0.0005, "Threads": 2}
         solver.set_params(params_config)
-        solver.solve()
-        logger.disabled = False
-        logging.disable(logging.NOTSET)
+        with QuietLogging():
+            solver.solve()
 
         # (3) Save results:
-        Y_solution = {str(keys): value.X for keys, value in solver.model._Y.items()}
+        Y_vars = solver.model._Y
+        Y_values = solver.model.getAttr("X", list(Y_vars.values()))
+        Y_solution = dict(zip(map(str, Y_vars.keys()), Y_values))
         Y_solution["objective"] = solver.objective.getValue()
         Y_solution[
             "cost_installation_satellites"
@@ -46,12 +54,17 @@ class Main:
         Y_solution["cost_served_from_dc"] = solver.cost_served_from_dc.getValue()
         Y_solution["scenarios"] = self.instance.get_info()
 
-        path_file_output = (
-            self.folder_path + f"deterministic_{self.instance.id_instance}.json"
-        )
-        with open(path_file_output, "w") as file:
-            file.write(json.dumps(Y_solution, indent=4))
-        print(f"Results saved in {path_file_output}")
+        Y_solution["id_instance"] = self.instance.id_instance
+        self._results_file.write(json.dumps(Y_solution, separators=(",", ":")) + "\n")
+        self._results_file.flush()
+        self._results_written += 1
+        if self._results_written % self.FSYNC_EVERY == 0:
+            os.fsync(self._results_file.fileno())
+        print(f"Results appended to {self.path_results}")
 
         print("-----------------------------------")
         print(json.dumps(Y_solution, indent=4))
+
+        # release the Gurobi model now instead of waiting for GC, so peak
+        # memory across the batch stays at one model's footprint
+        solver.model.dispose()
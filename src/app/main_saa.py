@@ -4,8 +4,10 @@ from typing import Any, Dict, List
 from src.instance.experiment import Experiment
 from src.model.sample_average_approximation import SampleAverageApproximation
 from src.utils import LOGGER as logger
+from src.utils import configure_logging
 
 if __name__ == "__main__":
+    configure_logging()
     # (1) Generate instance:
     folder_path = "../results/saa/"
     logger.info("[MAIN SAA] Generating instances")
@@ -18,10 +20,10 @@ if __name__ == "__main__":
     run_time = 3600
     for i, experiment in enumerate(instances_generated):
         id_experiment = (1 + i) * 100
-        logger.info(f"[MAIN SAA] Experiment {id_experiment} started")
+        logger.info("[MAIN SAA] Experiment %s started", id_experiment)
         solver_saa = SampleAverageApproximation(
             experiment=experiment,
             id_experiment=id_experiment,
         )
         solver_saa.run()
-        logger.info(f"[MAIN SAA] Experiment {id_experiment} finished")
+        logger.info("[MAIN SAA] Experiment %s finished", id_experiment)
@@ -1,12 +1,16 @@
 """Module for classes used in the application model."""
 from typing import Dict, List
 
+import numpy as np
+
 
 class Locatable:
     """Class for objects that have a location in the map."""
 
     # pylint: disable=too-few-public-methods
 
+    __slots__ = ("lon", "lat")
+
     def __init__(
         self,
         lon: float,
@@ -21,6 +25,16 @@ class Pixel(Locatable):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "id_pixel",
+        "area_surface",
+        "speed_intra_stop",
+        "demand_by_period",
+        "drop_by_period",
+        "stop_by_period",
+        "k",
+    )
+
     def __init__(
         self,
         id_pixel: str,
@@ -38,9 +52,11 @@ class Pixel(Locatable):
         self.id_pixel = id_pixel
         self.area_surface = area_surface
         self.speed_intra_stop = speed_intra_stop
-        self.demand_by_period = []
-        self.drop_by_period = []
-        self.stop_by_period = []
+        # period series are float64 arrays so the CA kernel can take
+        # views without converting boxed floats
+        self.demand_by_period = np.empty(0, dtype=np.float64)
+        self.drop_by_period = np.empty(0, dtype=np.float64)
+        self.stop_by_period = np.empty(0, dtype=np.float64)
         self.k = k
 
 
@@ -49,6 +65,17 @@ class Satellite(Locatable):
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "id_satellite",
+        "distance_from_dc",
+        "travel_time_from_dc",
+        "travel_time_in_traffic_from_dc",
+        "cost_fixed",
+        "cost_operation",
+        "cost_sourcing",
+        "capacity",
+    )
+
     def __init__(
         self,
         id_satellite: str,
@@ -83,6 +110,24 @@ class Vehicle:
 
     # pylint: disable=too-many-instance-attributes
 
+    __slots__ = (
+        "id_vehicle",
+        "type_vehicle",
+        "capacity",
+        "cost_fixed",
+        "cost_hourly",
+        "cost_km",
+        "cost_item",
+        "time_set_up",
+        "time_service",
+        "time_prep",
+        "time_loading_per_item",
+        "t_max",
+        "speed_linehaul",
+        "speed_interstop",
+        "k",
+    )
+
     def __init__(
         self,
         id_vehicle: str,
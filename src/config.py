@@ -1,7 +1,8 @@
 """Module to get configuration from json file"""
+from types import MappingProxyType
 
 # Configurations of the vehicles ME
-SMALL_CONFIG = {
+SMALL_CONFIG = MappingProxyType({
     "id_vehicle": "van",
     "type_vehicle": "small",
     "capacity": 115,
@@ -16,8 +17,8 @@ SMALL_CONFIG = {
     "cost_hourly": 53.9,
     "cost_km": 0.37,
     "cost_item": 0.5,
-}
-LARGE_CONFIG = {
+})
+LARGE_CONFIG = MappingProxyType({
     "id_vehicle": "truck",
     "type_vehicle": "large",
     "capacity": 460,
@@ -33,11 +34,11 @@ LARGE_CONFIG = {
     "cost_km": 8.7,
     "cost_item": 0.5,
     "k": 1,
-}
+})
 
 
 # Configurations of the vehicles PROVIDED
-# SMALL_CONFIG = {
+# SMALL_CONFIG = MappingProxyType({
 #     "id_vehicle": "van",
 #     "type_vehicle": "small",
 #     "capacity": 200,
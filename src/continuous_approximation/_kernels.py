@@ -0,0 +1,128 @@
+"""Numeric kernels of the continuous approximation.
+
+The kernel is a module-level function over plain ndarrays and scalars so
+the hot math carries no instance state or method dispatch. The project
+does not depend on a JIT compiler, so the kernel stays in NumPy, whose
+ufuncs already run the loops natively.
+"""
+from typing import Dict
+
+import numpy as np
+
+
+def compute_metrics(
+    demand: np.ndarray,
+    drop: np.ndarray,
+    stop: np.ndarray,
+    area: np.ndarray,
+    k_pixel: np.ndarray,
+    distance: np.ndarray,
+    capacity: float,
+    k_vehicle: float,
+    speed_linehaul: float,
+    speed_interstop: float,
+    time_set_up: float,
+    time_service: float,
+    time_prep: float,
+    time_loading_per_item: float,
+    t_max: float,
+    cost_hourly: float,
+    cost_km: float,
+    cost_fixed: float,
+) -> Dict[str, np.ndarray]:  # pylint: disable=too-many-arguments
+    """Evaluate all CA formulas over the full (s, k, t) grid at once.
+
+    `demand`, `drop` and `stop` have shape (T, K), `area` and `k_pixel`
+    shape (K,), and `distance` shape (K,) for the dc echelon or (S, K)
+    for the satellite echelon. Returns one array per metric, of shape
+    (T, K) or (S, T, K) accordingly.
+    """
+    # align the distance terms with the (.., T, K) grid
+    distance = np.expand_dims(distance, -2)
+
+    # fold the per-vehicle constants once so the grid ops below are
+    # multiplications instead of divisions by a scalar
+    inv_speed_interstop = 1.0 / speed_interstop
+    linehaul_dist_coef = 2.0 * k_vehicle
+    linehaul_time_coef = linehaul_dist_coef / speed_linehaul
+    cost_linehaul_time_coef = cost_hourly * linehaul_time_coef
+    cost_linehaul_dist_coef = cost_km * linehaul_dist_coef
+
+    # cells without demand are computed branchlessly and zeroed afterwards
+    bad = (drop <= 0) | (stop <= 0) | (demand <= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inv_sqrt_rho = np.reciprocal(np.sqrt(drop / area[None, :]))
+        effective_capacity = capacity / drop
+        # shared sub-expressions computed once: the time terms are the
+        # distance terms divided by the respective speed
+        distance_intra_stop = (k_vehicle * k_pixel[None, :]) * inv_sqrt_rho
+        time_intra_stop = distance_intra_stop * inv_speed_interstop
+        distance_linehaul = linehaul_dist_coef * distance
+        time_linehaul = linehaul_time_coef * distance
+        time_average_tour = time_set_up + time_service * drop + time_intra_stop
+        time_set_up_fully_loaded = time_prep + (
+            time_loading_per_item * effective_capacity * drop + time_linehaul
+        )
+        num_fully_loaded_tours = t_max / (
+            effective_capacity * time_average_tour + time_set_up_fully_loaded
+        )
+        num_customers_per_route = effective_capacity * np.minimum(
+            1.0, num_fully_loaded_tours
+        )
+        num_tours = np.maximum(num_fully_loaded_tours, 1.0)
+        distance_tour = num_customers_per_route * distance_intra_stop
+
+        # (7) average fleet size
+        denominador = num_fully_loaded_tours * effective_capacity
+        fleet_size = np.where(denominador > 0, stop / denominador, 0.0)
+
+        # (1) cost to set up
+        cost_prep = cost_hourly * (
+            time_prep + time_loading_per_item * drop * num_customers_per_route
+        )
+        # (2) cost line haul
+        cost_linehaul_time = cost_linehaul_time_coef * distance
+        cost_linehaul_distance = cost_linehaul_dist_coef * distance
+        # (3) cost intra stop
+        cost_segment_time = cost_fixed * num_customers_per_route * time_average_tour
+        cost_segment_distance = cost_km * distance_tour
+        total = (
+            fleet_size
+            * num_tours
+            * (
+                cost_prep  # Component 1: Set-Up Costs
+                + cost_linehaul_time
+                + cost_linehaul_distance  # Component 2: Line Haul Time + Distance Costs
+                + cost_segment_time
+                + cost_segment_distance  # Component 3: Intra-Route Costs
+            )
+        )
+
+    def expand(values: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(values, total.shape)
+
+    metrics = {
+        "total": total,
+        "cost_prep": expand(cost_prep),
+        "cost_linehaul_time": expand(cost_linehaul_time),
+        "cost_linehaul_distance": expand(cost_linehaul_distance),
+        "cost_segment_time": cost_segment_time,
+        "cost_segment_distance": cost_segment_distance,
+        "avg_fleet_size": fleet_size,
+        "num_tours": num_tours,
+        "fleet_size": fleet_size,
+        "avg_tour_time_full_loaded": expand(time_average_tour),
+        "num_fully_loaded_tours": num_fully_loaded_tours,
+        "effective_capacity": expand(effective_capacity),
+        "demand_served": expand(demand),
+        "avg_drop": expand(drop),
+        "avg_stop": expand(stop),
+        "avg_time_tour": expand(time_average_tour),
+        "avg_time_line_haul": expand(time_linehaul),
+    }
+    # zero out cells with no demand, keeping the observed series values
+    keep_raw = ("demand_served", "avg_drop", "avg_stop")
+    for name, values in metrics.items():
+        if name not in keep_raw:
+            metrics[name] = np.where(bad, 0.0, values)
+    return metrics
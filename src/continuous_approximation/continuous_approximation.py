@@ -1,8 +1,10 @@
 """Module for continuous approximation of discrete data."""
-import math
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
 
 from src.classes import Pixel, Satellite, Vehicle
+from src.continuous_approximation._kernels import compute_metrics
 from src.utils import LOGGER as logger
 
 
@@ -25,6 +27,31 @@ class ContinuousApproximation:
     - distance_matrixes: Dict[str, Any]
     """
 
+    # bound on distinct demand realizations kept in the kernel cache
+    METRICS_CACHE_SIZE = 32
+
+    FLEET_SIZE_FIELDS = (
+        "fleet_size",
+        "avg_tour_time_full_loaded",
+        "num_fully_loaded_tours",
+        "effective_capacity",
+        "demand_served",
+        "avg_drop",
+        "avg_stop",
+        "avg_time_tour",
+        "avg_time_line_haul",
+    )
+    COST_FIELDS = (
+        "total",
+        "cost_prep",
+        "cost_linehaul_time",
+        "cost_linehaul_distance",
+        "cost_segment_time",
+        "cost_segment_distance",
+        "avg_fleet_size",
+        "num_tours",
+    )
+
     def __init__(
         self,
         satellites: Dict[str, Satellite],
@@ -37,261 +64,176 @@ class ContinuousApproximation:
         self.periods: int = periods
         self.distance_matrixes: Dict[str, Any] = matrixes
 
-    def __effective_vehicle_capacity(
-        self, vehicle: Vehicle, pixel: Pixel, t: int
-    ) -> float:
-        """Calculate the effective vehicle capacity for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return vehicle.capacity / pixel.drop_by_period[t]
-
-    def __time_intra_stop(self, pixel: Pixel, vehicle: Vehicle, t: int) -> float:
-        """Calculate the time intra stop for a pixel and a vehicle at a given period."""
-        return (vehicle.k * pixel.k) / (
-            vehicle.speed_interstop
-            * math.sqrt(pixel.drop_by_period[t] / pixel.area_surface)
-        )
-
-    def __distance_intra_stop(self, pixel: Pixel, vehicle: Vehicle, t: int) -> float:
-        """Calculate the distance intra stop for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return (vehicle.k * pixel.k) / math.sqrt(
-            pixel.drop_by_period[t] / pixel.area_surface
-        )
-
-    def __time_linehaul(self, vehicle: Vehicle, distance: float) -> float:
-        """Calculate the time line haul for a pixel and a vehicle at a given period."""
-        return 2 * (distance * vehicle.k / vehicle.speed_linehaul)
-
-    def __distance_linehaul(self, vehicle: Vehicle, distance: float) -> float:
-        """Calculate the distance line haul for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return 2 * distance * vehicle.k
-
-    def __time_average_tour(self, pixel: Pixel, vehicle: Vehicle, t: int) -> float:
-        """Calculate the average tour time for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return (
-            vehicle.time_set_up
-            + vehicle.time_service * pixel.drop_by_period[t]
-            + self.__time_intra_stop(pixel, vehicle, t)
-        )
-
-    def __distance_tour(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the distance tour for a pixel and a vehicle at a given period."""
-        return self.__num_customers_per_route(
-            pixel, vehicle, t, distance
-        ) * self.__distance_intra_stop(pixel, vehicle, t)
-
-    def __time_set_up_fully_loaded_tours(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the time set up fully loaded tours for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return vehicle.time_prep + (
-            vehicle.time_loading_per_item
-            * self.__effective_vehicle_capacity(vehicle, pixel, t)
-            * pixel.drop_by_period[t]
-            + self.__time_linehaul(vehicle, distance)
-        )
-
-    def __num_fully_loaded_tours(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the number of fully loaded tours for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return vehicle.t_max / (
-            self.__effective_vehicle_capacity(vehicle, pixel, t)
-            * self.__time_average_tour(pixel, vehicle, t)
-            + self.__time_set_up_fully_loaded_tours(pixel, vehicle, t, distance)
+        # dense distance arrays indexed by integer ids, built once so the
+        # per-call path is an array gather instead of dict lookups
+        self._pixel_index: Dict[str, int] = {
+            k: j for j, k in enumerate(matrixes["dc"].keys())
+        }
+        self._dist_dc = np.fromiter(
+            matrixes["dc"].values(), dtype=np.float64, count=len(self._pixel_index)
         )
-
-    def __num_customers_per_route(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the number of customers per route for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        return self.__effective_vehicle_capacity(vehicle, pixel, t) * min(
-            1, self.__num_fully_loaded_tours(pixel, vehicle, t, distance)
+        sat_index = {s: i for i, s in enumerate(satellites.keys())}
+        self._dist_satellite = np.zeros(
+            (len(satellites), len(self._pixel_index)), dtype=np.float64
         )
-
-    def __num_tours(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the number of tours for a pixel and a vehicle at a given period."""
-        return max(self.__num_fully_loaded_tours(pixel, vehicle, t, distance), 1)
-
-    def __average_fleet_size(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the average fleet size for a pixel and a vehicle at a given period."""  # pylint: disable=line-too-long
-        if (
-            pixel.drop_by_period[t] <= 0
-            or pixel.stop_by_period[t] <= 0
-            or pixel.demand_by_period[t] <= 0
-        ):
-            logger.warning(
-                f"[CONTINUOUS APPROXIMATION] Pixel {pixel.id_pixel} in period {t} has no demand or no stops or no drops"
-            )
-            return {
-                "fleet_size": 0,
-                "avg_tour_time": 0,
-                "fully_loaded_tours": 0,
-                "effective_capacity": 0,
-                "demand_served": pixel.demand_by_period[t],
-                "avg_drop": pixel.drop_by_period[t],
-                "avg_stop": pixel.stop_by_period[t],
-                "avg_time": 0,
-                "avg_time_dispatch": 0,
-                "avg_time_line_haul": 0,
-            }
-
-        # (7) average fleet size
-        numerador = pixel.stop_by_period[t]
-        denominador = self.__num_fully_loaded_tours(
-            pixel, vehicle, t, distance
-        ) * self.__effective_vehicle_capacity(vehicle, pixel, t)
-        v = (numerador / denominador) if denominador > 0 else 0.0
-
-        return {
-            "fleet_size": v,
-            "avg_tour_time_full_loaded": self.__time_average_tour(pixel, vehicle, t),
-            "num_fully_loaded_tours": self.__num_fully_loaded_tours(
-                pixel, vehicle, t, distance
+        for (s, k), value in matrixes["satellite"].items():
+            if s in sat_index and k in self._pixel_index:
+                self._dist_satellite[sat_index[s], self._pixel_index[k]] = value
+
+        # kernel results memoized by demand realization: SAA scenarios that
+        # sample the same series hit the cache instead of recomputing
+        self._metrics_cache: Dict[Any, Any] = {}
+
+    def __build_pixel_arrays(
+        self, pixels: Dict[str, Pixel]
+    ) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """Stack the per-pixel period series into (T, K) arrays (SoA layout)."""
+        T = self.periods
+        ids = list(pixels.keys())
+        arrays = {
+            "demand": np.array(
+                [pixel.demand_by_period[:T] for pixel in pixels.values()],
+                dtype=np.float64,
+            ).T,
+            "drop": np.array(
+                [pixel.drop_by_period[:T] for pixel in pixels.values()],
+                dtype=np.float64,
+            ).T,
+            "stop": np.array(
+                [pixel.stop_by_period[:T] for pixel in pixels.values()],
+                dtype=np.float64,
+            ).T,
+            "area": np.array(
+                [pixel.area_surface for pixel in pixels.values()], dtype=np.float64
             ),
-            "effective_capacity": self.__effective_vehicle_capacity(vehicle, pixel, t),
-            "demand_served": pixel.demand_by_period[t],
-            "avg_drop": pixel.drop_by_period[t],
-            "avg_stop": pixel.stop_by_period[t],
-            "avg_time_tour": self.__time_average_tour(pixel, vehicle, t),
-            "avg_time_line_haul": self.__time_linehaul(vehicle, distance),
+            "k": np.array([pixel.k for pixel in pixels.values()], dtype=np.float64),
         }
+        return ids, arrays
 
-    def __cost_serve_pixel(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> float:
-        """Calculate the cost to serve a pixel with a vehicle in a period of time."""
-        if (
-            pixel.drop_by_period[t] <= 0
-            or pixel.stop_by_period[t] <= 0
-            or pixel.demand_by_period[t] <= 0
-        ):
+    def __build_distance_array(self, echelon: str, ids: List[str]) -> np.ndarray:
+        """Gather the distances of the echelon as a (K,) or (S, K) array."""
+        columns = [self._pixel_index[k] for k in ids]
+        if echelon == "dc":
+            return self._dist_dc[columns]
+        return self._dist_satellite[:, columns]
+
+    def __compute_metrics(
+        self, pixels: Dict[str, Pixel], vehicle: Vehicle, echelon: str
+    ) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """Run the CA kernel over the full (s, k, t) grid.
+
+        Returns the pixel ids and one array per metric, of shape (T, K) for
+        the dc echelon or (S, T, K) for the satellite echelon.
+        """
+        ids, pixel_arrays = self.__build_pixel_arrays(pixels)
+        cache_key = (
+            echelon,
+            vehicle.id_vehicle,
+            tuple(ids),
+            pixel_arrays["demand"].tobytes(),
+            pixel_arrays["drop"].tobytes(),
+            pixel_arrays["stop"].tobytes(),
+        )
+        cached = self._metrics_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        distance = self.__build_distance_array(echelon, ids)
+
+        # one summary warning instead of a formatted log per empty cell
+        no_demand = int(
+            (
+                (pixel_arrays["drop"] <= 0)
+                | (pixel_arrays["stop"] <= 0)
+                | (pixel_arrays["demand"] <= 0)
+            ).sum()
+        )
+        if no_demand:
             logger.warning(
-                f"[CONTINUOUS APPROXIMATION] Pixel {pixel.id_pixel} "
-                f"in period {t} has no demand or no stops or no drops"
+                "[CONTINUOUS APPROXIMATION] %s pixel-periods have no demand or no stops or no drops",
+                no_demand,
             )
-            return {
-                "total": 0,
-                "cost_prep": 0,
-                "cost_linehaul_time": 0,
-                "cost_linehaul_distance": 0,
-                "cost_segment_time": 0,
-                "cost_segment_distance": 0,
-                "avg_fleet_size": 0,
-                "num_tours": 0,
-            }
 
-        # (1) cost to set up
-        cost_prep = vehicle.cost_hourly * (
-            vehicle.time_prep
-            + vehicle.time_loading_per_item
-            * pixel.drop_by_period[t]
-            * self.__num_customers_per_route(pixel, vehicle, t, distance)
+        metrics = compute_metrics(
+            demand=pixel_arrays["demand"],
+            drop=pixel_arrays["drop"],
+            stop=pixel_arrays["stop"],
+            area=pixel_arrays["area"],
+            k_pixel=pixel_arrays["k"],
+            distance=distance,
+            capacity=vehicle.capacity,
+            k_vehicle=vehicle.k,
+            speed_linehaul=vehicle.speed_linehaul,
+            speed_interstop=vehicle.speed_interstop,
+            time_set_up=vehicle.time_set_up,
+            time_service=vehicle.time_service,
+            time_prep=vehicle.time_prep,
+            time_loading_per_item=vehicle.time_loading_per_item,
+            t_max=vehicle.t_max,
+            cost_hourly=vehicle.cost_hourly,
+            cost_km=vehicle.cost_km,
+            cost_fixed=vehicle.cost_fixed,
         )
+        if len(self._metrics_cache) >= self.METRICS_CACHE_SIZE:
+            self._metrics_cache.pop(next(iter(self._metrics_cache)))
+        self._metrics_cache[cache_key] = (ids, metrics)
+        return ids, metrics
 
-        # (2) cost line haul
-        cost_linehaul_time = vehicle.cost_hourly * self.__time_linehaul(
-            vehicle, distance
-        )
-        cost_linehaul_distance = vehicle.cost_km * self.__distance_linehaul(
-            vehicle, distance
-        )
-
-        # (3) cost intra stop
-        cost_segment_time = (
-            vehicle.cost_fixed
-            * self.__num_customers_per_route(pixel, vehicle, t, distance)
-            * self.__time_average_tour(pixel, vehicle, t)
-        )
-        cost_segment_distance = vehicle.cost_km * self.__distance_tour(
-            pixel, vehicle, t, distance
+    def __build_result_dict(
+        self, ids: List[str], metrics: Dict[str, np.ndarray], fields: Tuple[str, ...]
+    ) -> Dict[Any, Dict[str, float]]:
+        """Rebuild the keyed dict-of-dicts the solvers consume.
+
+        The kernel output stays one array per metric (SoA); each field is
+        converted to Python floats once at C level with tolist and the
+        rows are zipped, instead of boxing every cell individually.
+        """
+        if metrics[fields[0]].ndim == 2:
+            keys = [(k, t) for t in range(self.periods) for k in ids]
+        else:
+            keys = [
+                (s, k, t)
+                for s in self.satellites.keys()
+                for t in range(self.periods)
+                for k in ids
+            ]
+        columns = [metrics[name].ravel().tolist() for name in fields]
+        return {key: dict(zip(fields, row)) for key, row in zip(keys, zip(*columns))}
+
+    def __vehicle_for(self, echelon: str) -> Vehicle:
+        """Resolve the vehicle serving the echelon once per public call."""
+        return self.vehicles["large"] if echelon == "dc" else self.vehicles["small"]
+
+    def get_all(
+        self, pixels: Dict[str, Pixel], echelon: str
+    ) -> Tuple[Dict[Any, Dict[str, float]], Dict[Any, Dict[str, float]]]:
+        """Calculate serving costs and fleet sizes in a single kernel pass.
+
+        Returns the (cost, fleet_size) pair that get_cost_serve_pixel and
+        get_average_fleet_size would produce separately.
+        """
+        ids, metrics = self.__compute_metrics(
+            pixels, self.__vehicle_for(echelon), echelon
         )
-
-        # (4) cost average fleet size
-        avg_fleet_size = self.__average_fleet_size(pixel, vehicle, t, distance)[
-            "fleet_size"
-        ]
-        num_tours = self.__num_tours(pixel, vehicle, t, distance)
-        cost = (
-            avg_fleet_size
-            * num_tours
-            * (
-                cost_prep  # Component 1: Set-Up Costs
-                + cost_linehaul_time
-                + cost_linehaul_distance  # Component 2: Line Haul Time + Distance Costs
-                + cost_segment_time
-                + cost_segment_distance  # Component 3: Intra-Route Costs
-                # + vehicle.cost_item
-                # * pixel.drop_by_period[t]
-                # * self.__num_customers_per_route(
-                #     pixel, vehicle, t, distance
-                # )  # Component 4: Parcel-Based Costs
-            )
+        return (
+            self.__build_result_dict(ids, metrics, self.COST_FIELDS),
+            self.__build_result_dict(ids, metrics, self.FLEET_SIZE_FIELDS),
         )
-        return {
-            "total": cost,
-            "cost_prep": cost_prep,
-            "cost_linehaul_time": cost_linehaul_time,
-            "cost_linehaul_distance": cost_linehaul_distance,
-            "cost_segment_time": cost_segment_time,
-            "cost_segment_distance": cost_segment_distance,
-            "avg_fleet_size": avg_fleet_size,
-            "num_tours": num_tours,
-        }
 
     def get_average_fleet_size(
         self, pixels: Dict[str, Pixel], echelon: str
     ) -> Dict[Any, Dict[str, float]]:
         """Calculate the average fleet size for a pixel in a period of time."""
-        fleet_size = {}
-        if echelon == "dc":
-            for t in range(self.periods):
-                for k, pixel in pixels.items():
-                    fleet_size[(k, t)] = self.__average_fleet_size(
-                        pixel,
-                        self.vehicles["large"],
-                        t,
-                        self.distance_matrixes[echelon][k],
-                    )
-        else:
-            for t in range(self.periods):
-                for s in self.satellites.keys():
-                    for k, pixel in pixels.items():
-                        fleet_size[(s, k, t)] = self.__average_fleet_size(
-                            pixel,
-                            self.vehicles["small"],
-                            t,
-                            self.distance_matrixes[echelon][(s, k)],
-                        )
-
-        return fleet_size
+        ids, metrics = self.__compute_metrics(
+            pixels, self.__vehicle_for(echelon), echelon
+        )
+        return self.__build_result_dict(ids, metrics, self.FLEET_SIZE_FIELDS)
 
     def get_cost_serve_pixel(
         self, pixels: Dict[str, Pixel], echelon: str
     ) -> Dict[Any, Dict[str, float]]:
         """Calculate the cost to serve a pixel in a period of time."""
-        cost = {}
-        if echelon == "dc":
-            for t in range(self.periods):
-                for k, pixel in pixels.items():
-                    cost[(k, t)] = self.__cost_serve_pixel(
-                        pixel,
-                        self.vehicles["large"],
-                        t,
-                        self.distance_matrixes[echelon][k],
-                    )
-        else:
-            for t in range(self.periods):
-                for s in self.satellites.keys():
-                    for k, pixel in pixels.items():
-                        cost[(s, k, t)] = self.__cost_serve_pixel(
-                            pixel,
-                            self.vehicles["small"],
-                            t,
-                            self.distance_matrixes[echelon][(s, k)],
-                        )
-        return cost
+        ids, metrics = self.__compute_metrics(
+            pixels, self.__vehicle_for(echelon), echelon
+        )
+        return self.__build_result_dict(ids, metrics, self.COST_FIELDS)
@@ -1,64 +1,53 @@
 """Module to define the configuration of the CA"""
-import math
-import sys
 from typing import Any, Dict, Tuple
 
+import numpy as np
+
 from src.classes import Pixel, Satellite, Vehicle
 from src.constants import FEE_COST_FROM_DC, FEE_COST_FROM_SATELLITE
 from src.utils import LOGGER as logger
 
 
-class ContinuousApproximationConfig:
-    """Class to define the configuration of the CA"""
-
-    def __init__(
-        self,
-        periods: int,
-        small_vehicle: Vehicle,
-        large_vehicle: Vehicle,
-    ) -> None:
-        self.periods: int = periods
-        self.small_vehicle: Vehicle = small_vehicle
-        self.large_vehicle: Vehicle = large_vehicle
+def _avg_fleet_size_kernel(
+    demand: np.ndarray,
+    drop: np.ndarray,
+    stop: np.ndarray,
+    area: np.ndarray,
+    k_pixel: np.ndarray,
+    speed_intra: np.ndarray,
+    distance: np.ndarray,
+    capacity: float,
+    time_set_up: float,
+    time_service: float,
+    k_vehicle: float,
+    time_prep: float,
+    time_loading_per_item: float,
+    speed_linehaul: float,
+    t_max: float,
+) -> Dict[str, np.ndarray]:  # pylint: disable=too-many-arguments
+    """Calculate the average fleet size over the whole (s, k, t) grid.
 
-    def __avg_fleet_size(
-        self, pixel: Pixel, vehicle: Vehicle, t: int, distance: float
-    ) -> Dict[str, float]:
-        """Calculate the average fleet size for a pixel in a period of time"""
-        if (
-            pixel.drop_by_period[t] <= 0
-            or pixel.stop_by_period[t] <= 0
-            or pixel.demand_by_period[t] <= 0
-        ):
-            logger.warning(
-                f"[CA] Pixel {pixel.id_pixel} in period {t} "
-                f"has no demand or no stops or no drops"
-            )
-            return {
-                "fleet_size": 0,
-                "avg_tour_time": 0,
-                "fully_loaded_tours": 0,
-                "effective_capacity": 0,
-                "demand_served": pixel.demand_by_period[t],
-                "avg_drop": pixel.drop_by_period[t],
-                "avg_stop": pixel.stop_by_period[t],
-                "avg_time": 0,
-                "avg_time_dispatch": 0,
-                "avg_time_line_haul": 0,
-            }
+    A module-level function over plain arrays and scalars so the hot
+    math carries no instance state. `distance` has shape (K,) for the
+    dc echelon or (S, K) for the satellite echelon; the result arrays
+    have shape (T, K) or (S, T, K) accordingly. Degenerate cells (no
+    demand, drops or stops) are computed branchlessly and zeroed
+    afterwards.
+    """
+    # align the distance term with the trailing (.., T, K) axes
+    distance = np.expand_dims(distance, -2)
 
+    bad = (drop <= 0) | (stop <= 0) | (demand <= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
         # effective vehicle capacity
-        effective_vehicle_capacity = vehicle.capacity / pixel.drop_by_period[t]
+        effective_vehicle_capacity = capacity / drop
 
         # time services
-        time_services = (
-            vehicle.time_set_up + vehicle.time_service * pixel.drop_by_period[t]
-        )
+        time_services = time_set_up + time_service * drop
 
         # time intra stop
-        time_intra_stop = (vehicle.k * pixel.k) / (
-            pixel.speed_intra_stop[vehicle.type_vehicle]
-            * math.sqrt(pixel.drop_by_period[t] / pixel.area_surface)
+        time_intra_stop = (k_vehicle * k_pixel[None, :]) / (
+            speed_intra[None, :] * np.sqrt(drop / area[None, :])
         )
 
         # average tour time
@@ -66,37 +55,166 @@ class ContinuousApproximationConfig:
 
         # time preparing
         time_preparing_dispatch = (
-            vehicle.time_prep
-            + effective_vehicle_capacity
-            * pixel.drop_by_period[t]
-            * vehicle.time_loading_per_item
+            time_prep + effective_vehicle_capacity * drop * time_loading_per_item
         )
 
         # time line_haul
-        time_line_haul = 2 * (distance * vehicle.k / vehicle.speed_linehaul)
+        time_line_haul = 2 * (distance * k_vehicle / speed_linehaul)
 
         # number of fully loaded tours
-        beta = vehicle.t_max / (
-            avg_tour_time + time_preparing_dispatch + time_line_haul
-        )
         avg_time = avg_tour_time + time_preparing_dispatch + time_line_haul
+        beta = t_max / avg_time
 
         # average fleet size
-        numerador = pixel.stop_by_period[t]
         denominador = beta * effective_vehicle_capacity
-        v = (numerador / denominador) if denominador > 0 else 0.0
+        fleet_size = np.where(denominador > 0, stop / denominador, 0.0)
+
+    def expand(values: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(values, fleet_size.shape)
+
+    metrics = {
+        "fleet_size": fleet_size,
+        "avg_tour_time": expand(avg_tour_time),
+        "fully_loaded_tours": beta,
+        "effective_capacity": expand(effective_vehicle_capacity),
+        "demand_served": expand(demand),
+        "avg_drop": expand(drop),
+        "avg_stop": expand(stop),
+        "avg_time": avg_time,
+        "avg_time_dispatch": expand(time_preparing_dispatch),
+        "avg_time_line_haul": expand(time_line_haul),
+    }
+    # zero out the degenerate cells, keeping the observed series values
+    keep_raw = ("demand_served", "avg_drop", "avg_stop")
+    for name, values in metrics.items():
+        if name not in keep_raw:
+            metrics[name] = np.where(bad, 0.0, values)
+    return metrics
+
+
+class ContinuousApproximationConfig:
+    """Class to define the configuration of the CA"""
 
+    __slots__ = ("periods", "small_vehicle", "large_vehicle", "_kernel_params")
+
+    FLEET_FIELDS = (
+        "fleet_size",
+        "avg_tour_time",
+        "fully_loaded_tours",
+        "effective_capacity",
+        "demand_served",
+        "avg_drop",
+        "avg_stop",
+        "avg_time",
+        "avg_time_dispatch",
+        "avg_time_line_haul",
+    )
+
+    def __init__(
+        self,
+        periods: int,
+        small_vehicle: Vehicle,
+        large_vehicle: Vehicle,
+    ) -> None:
+        self.periods: int = periods
+        self.small_vehicle: Vehicle = small_vehicle
+        self.large_vehicle: Vehicle = large_vehicle
+        # partial evaluation: the kernel scalars of each vehicle are
+        # extracted once here, so calls pass prebound constants instead
+        # of walking the attribute chains again
+        self._kernel_params: Dict[str, Dict[str, float]] = {
+            vehicle.type_vehicle: {
+                "capacity": vehicle.capacity,
+                "time_set_up": vehicle.time_set_up,
+                "time_service": vehicle.time_service,
+                "k_vehicle": vehicle.k,
+                "time_prep": vehicle.time_prep,
+                "time_loading_per_item": vehicle.time_loading_per_item,
+                "speed_linehaul": vehicle.speed_linehaul,
+                "t_max": vehicle.t_max,
+            }
+            for vehicle in (small_vehicle, large_vehicle)
+        }
+
+    def __build_pixel_arrays(
+        self, pixels: Dict[str, Pixel], vehicle: Vehicle
+    ) -> Dict[str, np.ndarray]:
+        """Stack the per-pixel attributes into (T, K) and (K,) arrays."""
+        T = self.periods
+        return {
+            "demand": np.array(
+                [pixel.demand_by_period[:T] for pixel in pixels.values()],
+                dtype=np.float64,
+            ).T,
+            "drop": np.array(
+                [pixel.drop_by_period[:T] for pixel in pixels.values()],
+                dtype=np.float64,
+            ).T,
+            "stop": np.array(
+                [pixel.stop_by_period[:T] for pixel in pixels.values()],
+                dtype=np.float64,
+            ).T,
+            "area": np.array(
+                [pixel.area_surface for pixel in pixels.values()], dtype=np.float64
+            ),
+            "k": np.array([pixel.k for pixel in pixels.values()], dtype=np.float64),
+            "speed_intra": np.array(
+                [
+                    pixel.speed_intra_stop[vehicle.type_vehicle]
+                    for pixel in pixels.values()
+                ],
+                dtype=np.float64,
+            ),
+        }
+
+    def __run_kernel(
+        self,
+        arrays: Dict[str, np.ndarray],
+        vehicle: Vehicle,
+        distance: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Invoke the kernel with the prebound constants of the vehicle."""
+        # one summary warning instead of a formatted message per cell,
+        # with lazy %s formatting so suppressed levels cost nothing
+        no_demand = int(
+            (
+                (arrays["drop"] <= 0)
+                | (arrays["stop"] <= 0)
+                | (arrays["demand"] <= 0)
+            ).sum()
+        )
+        if no_demand:
+            logger.warning(
+                "[CA] %s pixel-periods have no demand or no stops or no drops",
+                no_demand,
+            )
+        return _avg_fleet_size_kernel(
+            demand=arrays["demand"],
+            drop=arrays["drop"],
+            stop=arrays["stop"],
+            area=arrays["area"],
+            k_pixel=arrays["k"],
+            speed_intra=arrays["speed_intra"],
+            distance=distance,
+            **self._kernel_params[vehicle.type_vehicle],
+        )
+
+    def __build_result_dict(
+        self,
+        keys: list,
+        metrics: Dict[str, np.ndarray],
+    ) -> Dict[Any, Dict[str, float]]:
+        """Package the metric arrays into the keyed dict the callers consume.
+
+        The kernel output stays one contiguous array per field (SoA);
+        each column is converted to Python floats once at C level with
+        tolist and the rows are zipped, instead of boxing every cell
+        individually.
+        """
+        columns = [metrics[name].ravel().tolist() for name in self.FLEET_FIELDS]
         return {
-            "fleet_size": v,
-            "avg_tour_time": avg_tour_time,
-            "fully_loaded_tours": beta,
-            "effective_capacity": effective_vehicle_capacity,
-            "demand_served": pixel.demand_by_period[t],
-            "avg_drop": pixel.drop_by_period[t],
-            "avg_stop": pixel.stop_by_period[t],
-            "avg_time": avg_time,
-            "avg_time_dispatch": time_preparing_dispatch,
-            "avg_time_line_haul": time_line_haul,
+            key: dict(zip(self.FLEET_FIELDS, row))
+            for key, row in zip(keys, zip(*columns))
         }
 
     def calculate_avg_fleet_size_from_satellites(
@@ -106,43 +224,76 @@ class ContinuousApproximationConfig:
         satellites: Dict[str, Satellite],
     ) -> Dict[Any, float]:
         """Calculate the average fleet size for a pixel in a period of time"""
-        # logger.info("[CA] Estimation of fleet size running for satellites")
-        fleet_size = dict(
-            [
-                (
-                    (s, k, t),
-                    self.__avg_fleet_size(
-                        pixel, self.small_vehicle, t, distances_line_haul[(s, k)]
-                    ),
-                )
-                for t in range(self.periods)
-                for s in satellites.keys()
-                for k, pixel in pixels.items()
-            ]
+        fleet_size, _ = self.fleet_size_from_satellites(
+            pixels, distances_line_haul, satellites
         )
         return fleet_size
 
+    def fleet_size_from_satellites(
+        self,
+        pixels: Dict[str, Pixel],
+        distances_line_haul: Dict[Any, float],
+        satellites: Dict[str, Satellite],
+    ) -> Tuple[Dict[Any, Dict[str, float]], np.ndarray]:
+        """Fleet size dict plus the raw fleet_size column as an (S, K, T) array.
+
+        `distances_line_haul` may be the tuple-keyed dict or an already
+        gathered (S, K) array aligned with the iteration order of
+        `satellites` and `pixels`.
+        """
+        # logger.info("[CA] Estimation of fleet size running for satellites")
+        arrays = self.__build_pixel_arrays(pixels, self.small_vehicle)
+        if isinstance(distances_line_haul, np.ndarray):
+            distance = distances_line_haul
+        else:
+            distance = np.array(
+                [
+                    [distances_line_haul[(s, k)] for k in pixels.keys()]
+                    for s in satellites
+                ],
+                dtype=np.float64,
+            )
+        metrics = self.__run_kernel(arrays, self.small_vehicle, distance)
+        keys = [
+            (s, k, t)
+            for s in satellites.keys()
+            for t in range(self.periods)
+            for k in pixels.keys()
+        ]
+        fleet_size_array = metrics["fleet_size"].transpose(0, 2, 1)
+        return self.__build_result_dict(keys, metrics), fleet_size_array
+
     def calculate_avg_fleet_size_from_dc(
         self,
         pixels: Dict[str, Pixel],
         distances_line_haul: Dict[str, float],
     ) -> Dict[Any, float]:
         """Calculate the average fleet size for a pixel in a period of time"""
-        # logger.info("[CA] Estimation of fleet size running for DC")
-        fleet_size = dict(
-            [
-                (
-                    (k, t),
-                    self.__avg_fleet_size(
-                        pixel, self.large_vehicle, t, distances_line_haul[k]
-                    ),
-                )
-                for t in range(self.periods)
-                for k, pixel in pixels.items()
-            ]
-        )
+        fleet_size, _ = self.fleet_size_from_dc(pixels, distances_line_haul)
         return fleet_size
 
+    def fleet_size_from_dc(
+        self,
+        pixels: Dict[str, Pixel],
+        distances_line_haul: Dict[str, float],
+    ) -> Tuple[Dict[Any, Dict[str, float]], np.ndarray]:
+        """Fleet size dict plus the raw fleet_size column as a (K, T) array.
+
+        `distances_line_haul` may be the pixel-keyed dict or an already
+        gathered (K,) array aligned with the iteration order of `pixels`.
+        """
+        # logger.info("[CA] Estimation of fleet size running for DC")
+        arrays = self.__build_pixel_arrays(pixels, self.large_vehicle)
+        if isinstance(distances_line_haul, np.ndarray):
+            distance = distances_line_haul
+        else:
+            distance = np.array(
+                [distances_line_haul[k] for k in pixels.keys()], dtype=np.float64
+            )
+        metrics = self.__run_kernel(arrays, self.large_vehicle, distance)
+        keys = [(k, t) for t in range(self.periods) for k in pixels.keys()]
+        return self.__build_result_dict(keys, metrics), metrics["fleet_size"].T
+
 
 def cost_satellite_to_pixel(
     satellites: Dict[str, Satellite],
@@ -151,70 +302,80 @@ def cost_satellite_to_pixel(
     periods: int,
     fleet_size_required: Dict[Tuple[str, str], float],
     distance_line_haul: Dict[Tuple[str, str], float],
+    fleet_size_array: np.ndarray = None,
 ) -> Dict[Tuple[str, str, int], float]:  # pylint: disable=too-many-arguments
-    """Calculate the cost from satellite to pixel by period"""
-    # cost of shipping from satellite to pixel
-    distance_average_from_satellites = {}
-    for s in satellites.keys():
-        min_distances, max_distances = sys.maxsize, -sys.maxsize - 1
-        for k in pixels.keys():
-            min_distances = (
-                min_distances
-                if distance_line_haul[(s, k)] > min_distances
-                else distance_line_haul[(s, k)]
-            )
-            max_distances = (
-                max_distances
-                if distance_line_haul[(s, k)] < max_distances
-                else distance_line_haul[(s, k)]
-            )
-        distance_average_from_satellites[s] = {
-            "min": min_distances,
-            "max": max_distances,
-            "interval": max_distances - min_distances,
-            "cost": 0.421 - 0.335,
-        }  # TODO: validate this cost
-    cost_shipping_from_satellites = dict(
-        [
-            (
-                (s, k),
-                distance_average_from_satellites[(s)]["cost"]
-                / distance_average_from_satellites[(s)]["interval"]
-                * (
-                    distance_line_haul[(s, k)]
-                    - distance_average_from_satellites[(s)]["min"]
-                )
-                + FEE_COST_FROM_SATELLITE,
-            )
-            for s in satellites.keys()
-            for k in pixels.keys()
-        ]
+    """Calculate the cost from satellite to pixel by period.
+
+    `fleet_size_array`, when given, is the raw (S, K, T) fleet_size
+    column aligned with the iteration order of `satellites` and
+    `pixels`; it spares re-reading the fleet-size dict entry by entry.
+    """
+    s_keys = list(satellites.keys())
+    k_keys = list(pixels.keys())
+
+    # cost of shipping from satellite to pixel: the per-satellite
+    # distance stats are SIMD reductions over one (S, K) array instead
+    # of a hand-rolled branchy scan per pair
+    if isinstance(distance_line_haul, np.ndarray):
+        distance = distance_line_haul
+    else:
+        distance = np.array(
+            [[distance_line_haul[(s, k)] for k in k_keys] for s in s_keys],
+            dtype=np.float64,
+        )
+    min_distance = distance.min(axis=1, keepdims=True)
+    interval = np.ptp(distance, axis=1, keepdims=True)
+    cost = 0.421 - 0.335  # TODO: validate this cost
+    shipping_rate = cost / interval * (distance - min_distance) + FEE_COST_FROM_SATELLITE
+
+    # compute the total cost: one broadcast multiply per component over
+    # the (S, K, T) grid instead of three scalar multiplies per cell
+    demand = np.array(
+        [pixel.demand_by_period[:periods] for pixel in pixels.values()],
+        dtype=np.float64,
     )
-    # compute the total cost
-    costs = {}
-    for t in range(periods):
-        for k, pixel in pixels.items():
-            for s, satellite in satellites.items():
-                cost_first_level = satellite.cost_sourcing * pixel.demand_by_period[t]
-                cost_shipping = (
-                    cost_shipping_from_satellites[(s, k)] * pixel.demand_by_period[t]
-                )
-                cost_vehicles = (
-                    vehicle.cost_fixed * fleet_size_required[(s, k, t)]["fleet_size"]
-                )
-
-                total_cost = (
-                    round(cost_first_level, 0)
-                    + round(cost_shipping, 0)
-                    + round(cost_vehicles, 1)
-                )
-                costs[(s, k, t)] = {
-                    "total": total_cost,
-                    "first_level": round(cost_first_level, 0),
-                    "shipping": round(cost_shipping, 0),
-                    "vehicles": round(cost_vehicles, 1),
-                }
-    return costs
+    sourcing = np.array(
+        [satellite.cost_sourcing for satellite in satellites.values()],
+        dtype=np.float64,
+    )
+    if fleet_size_array is not None:
+        fleet = fleet_size_array
+    else:
+        fleet = np.array(
+            [
+                [
+                    [
+                        fleet_size_required[(s, k, t)]["fleet_size"]
+                        for t in range(periods)
+                    ]
+                    for k in k_keys
+                ]
+                for s in s_keys
+            ],
+            dtype=np.float64,
+        )
+
+    cost_first_level = np.round(sourcing[:, None, None] * demand[None, :, :], 0)
+    cost_shipping = np.round(shipping_rate[:, :, None] * demand[None, :, :], 0)
+    cost_vehicles = np.round(vehicle.cost_fixed * fleet, 1)
+    total_cost = cost_first_level + cost_shipping + cost_vehicles
+
+    keys = [(s, k, t) for s in s_keys for k in k_keys for t in range(periods)]
+    rows = zip(
+        total_cost.ravel().tolist(),
+        cost_first_level.ravel().tolist(),
+        cost_shipping.ravel().tolist(),
+        cost_vehicles.ravel().tolist(),
+    )
+    return {
+        key: {
+            "total": total,
+            "first_level": first_level,
+            "shipping": shipping,
+            "vehicles": vehicles,
+        }
+        for key, (total, first_level, shipping, vehicles) in zip(keys, rows)
+    }
 
 
 def cost_dc_to_pixel(
@@ -223,56 +384,59 @@ def cost_dc_to_pixel(
     vehicle: Vehicle,
     fleet_size_required: Dict[str, dict],
     distance_line_haul: Dict[str, float],
+    fleet_size_array: np.ndarray = None,
 ) -> Dict[Any, float]:
-    """Calculate the cost from DC to pixel by period"""
-    # cost of shipping from DC to pixel
-    distance_average_from_dc = {}
-    min_distances, max_distances = sys.maxsize, -sys.maxsize - 1
-    for k in pixels.keys():
-        min_distances = (
-            min_distances
-            if distance_line_haul[(k)] > min_distances
-            else distance_line_haul[(k)]
-        )
-        max_distances = (
-            max_distances
-            if distance_line_haul[(k)] < max_distances
-            else distance_line_haul[(k)]
+    """Calculate the cost from DC to pixel by period.
+
+    `fleet_size_array`, when given, is the raw (K, T) fleet_size column
+    aligned with the iteration order of `pixels`.
+    """
+    k_keys = list(pixels.keys())
+
+    # cost of shipping from DC to pixel: the distance stats are SIMD
+    # reductions over one (K,) array instead of a hand-rolled branchy scan
+    if isinstance(distance_line_haul, np.ndarray):
+        distance = distance_line_haul
+    else:
+        distance = np.array(
+            [distance_line_haul[k] for k in k_keys], dtype=np.float64
         )
-    distance_average_from_dc = {
-        "min": min_distances,
-        "max": max_distances,
-        "interval": max_distances - min_distances,
-        "cost": 0.389 - 0.264,
-    }  # TODO: validate this cost
-    cost_shipping_from_dc = dict(
-        [
-            (
-                k,
-                distance_average_from_dc["cost"]
-                / distance_average_from_dc["interval"]
-                * (distance_line_haul[(k)] - distance_average_from_dc["min"])
-                + FEE_COST_FROM_DC,
-            )
-            for k in pixels.keys()
-        ]
+    min_distance = distance.min()
+    interval = np.ptp(distance)
+    cost = 0.389 - 0.264  # TODO: validate this cost
+    shipping_rate = cost / interval * (distance - min_distance) + FEE_COST_FROM_DC
+
+    # compute the total cost: one broadcast multiply per component over
+    # the (K, T) grid instead of two scalar multiplies per cell
+    demand = np.array(
+        [pixel.demand_by_period[:periods] for pixel in pixels.values()],
+        dtype=np.float64,
     )
-    # compute the total cost
-    costs = {}
-    for t in range(periods):
-        for k, pixel in pixels.items():
-            cost_shipping = cost_shipping_from_dc[k] * pixel.demand_by_period[t]
-            cost_vehicles = (
-                vehicle.cost_fixed * fleet_size_required[(k, t)]["fleet_size"]
-            )
+    if fleet_size_array is not None:
+        fleet = fleet_size_array
+    else:
+        fleet = np.array(
+            [
+                [fleet_size_required[(k, t)]["fleet_size"] for t in range(periods)]
+                for k in k_keys
+            ],
+            dtype=np.float64,
+        )
 
-            total_cost = round(cost_shipping, 0) + round(cost_vehicles, 1)
-            costs[(k, t)] = {
-                "total": total_cost,
-                "shipping": round(cost_shipping, 0),
-                "vehicles": round(cost_vehicles, 1),
-            }
-    return costs
+    cost_shipping = np.round(shipping_rate[:, None] * demand, 0)
+    cost_vehicles = np.round(vehicle.cost_fixed * fleet, 1)
+    total_cost = cost_shipping + cost_vehicles
+
+    keys = [(k, t) for k in k_keys for t in range(periods)]
+    rows = zip(
+        total_cost.ravel().tolist(),
+        cost_shipping.ravel().tolist(),
+        cost_vehicles.ravel().tolist(),
+    )
+    return {
+        key: {"total": total, "shipping": shipping, "vehicles": vehicles}
+        for key, (total, shipping, vehicles) in zip(keys, rows)
+    }
 
 
 def get_cost_from_continuous_approximation(
@@ -282,6 +446,7 @@ def get_cost_from_continuous_approximation(
     fleet_size_required: Dict[Any, Dict],
     distance_line_haul: Dict[str, Dict],
     periods: int,
+    fleet_size_arrays: Dict[str, np.ndarray] = None,
 ) -> Dict[str, Dict]:  # pylint: disable=too-many-arguments
     """
     Calculate the cost of serving a pixel by period
@@ -290,6 +455,7 @@ def get_cost_from_continuous_approximation(
     - Dict[str, Dict]
         the cost of serving a pixel by period, where the key is the echelon dc or satellite
     """
+    fleet_size_arrays = fleet_size_arrays if fleet_size_arrays is not None else {}
     cost_satellite_to_pixel_period = cost_satellite_to_pixel(
         satellites=satellites,
         pixels=pixels,
@@ -297,6 +463,7 @@ def get_cost_from_continuous_approximation(
         periods=periods,
         fleet_size_required=fleet_size_required["satellite"],
         distance_line_haul=distance_line_haul["satellite"],
+        fleet_size_array=fleet_size_arrays.get("satellite"),
     )
     cost_dc_to_pixel_period = cost_dc_to_pixel(
         pixels=pixels,
@@ -304,8 +471,65 @@ def get_cost_from_continuous_approximation(
         vehicle=vehicles["large"],
         fleet_size_required=fleet_size_required["dc"],
         distance_line_haul=distance_line_haul["dc"],
+        fleet_size_array=fleet_size_arrays.get("dc"),
     )
     return {
         "dc": cost_dc_to_pixel_period,
         "satellite": cost_satellite_to_pixel_period,
     }
+
+
+def compute_fleet_size_and_costs(
+    computer: ContinuousApproximationConfig,
+    satellites: Dict[str, Satellite],
+    pixels: Dict[str, Pixel],
+    vehicles: Dict[str, Vehicle],
+    distance_line_haul: Dict[str, Dict],
+    periods: int,
+) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:  # pylint: disable=too-many-arguments
+    """Calculate serving costs and required fleet sizes in one pass.
+
+    The raw fleet_size columns flow from the kernel straight into the
+    cost assembly, so the intermediate dict of S*K*T entries is built
+    once for the callers but never re-read here. The tuple-keyed
+    distance dicts are gathered into dense arrays once and shared by
+    both stages instead of being re-hashed per lookup.
+    """
+    distance_arrays = {
+        "satellite": np.array(
+            [
+                [distance_line_haul["satellite"][(s, k)] for k in pixels.keys()]
+                for s in satellites.keys()
+            ],
+            dtype=np.float64,
+        ),
+        "dc": np.array(
+            [distance_line_haul["dc"][k] for k in pixels.keys()], dtype=np.float64
+        ),
+    }
+    fleet_size_satellites, fleet_array_satellites = computer.fleet_size_from_satellites(
+        pixels=pixels,
+        distances_line_haul=distance_arrays["satellite"],
+        satellites=satellites,
+    )
+    fleet_size_dc, fleet_array_dc = computer.fleet_size_from_dc(
+        pixels=pixels,
+        distances_line_haul=distance_arrays["dc"],
+    )
+    fleet_size_required = {
+        "satellite": fleet_size_satellites,
+        "dc": fleet_size_dc,
+    }
+    costs = get_cost_from_continuous_approximation(
+        pixels=pixels,
+        satellites=satellites,
+        vehicles=vehicles,
+        fleet_size_required=fleet_size_required,
+        distance_line_haul=distance_arrays,
+        periods=periods,
+        fleet_size_arrays={
+            "satellite": fleet_array_satellites,
+            "dc": fleet_array_dc,
+        },
+    )
+    return costs, fleet_size_required
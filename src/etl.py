@@ -1,9 +1,12 @@
 """Module to get data from csv file"""
 import json
+import logging
 import os
 import sys
+from functools import lru_cache
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 from src.classes import Pixel, Satellite, Vehicle
@@ -18,9 +21,32 @@ from src.constants import (
 from src.utils import LOGGER as logger
 
 
+@lru_cache(maxsize=None)
+def _read_workbook(path: str, usecols: tuple = None) -> pd.DataFrame:
+    """Read an Excel workbook once and reuse the parsed frame.
+
+    `usecols` restricts the parse to the columns the loader actually
+    consumes, so the engine skips decoding the rest. The loaders
+    rebuild their objects from the frame on every call, so callers that
+    mutate the results (scenario series, satellite capacities) keep
+    their semantics; only the expensive parse is shared. The frames
+    themselves are never mutated.
+    """
+    return pd.read_excel(path, usecols=list(usecols) if usecols else None)
+
+
 class Data:
     """Class to get data from csv file"""
 
+    @staticmethod
+    def __as_dict(instance) -> Dict:
+        """Collect the attributes of a slotted instance for debug output."""
+        return {
+            slot: getattr(instance, slot)
+            for cls in type(instance).__mro__
+            for slot in getattr(cls, "__slots__", ())
+        }
+
     @staticmethod
     def load_satellites(
         show_data: bool = False,
@@ -30,36 +56,78 @@ class Data:
         if not os.path.isfile(PATH_DATA_SATELLITE):
             logger.error(f"[ETL] File {PATH_DATA_SATELLITE} not found")
             sys.exit(1)
-        df = pd.read_excel(PATH_DATA_SATELLITE)
+        df = _read_workbook(
+            PATH_DATA_SATELLITE,
+            usecols=(
+                "id_satellite",
+                "lon",
+                "lat",
+                "distance",
+                "travel_time_from_dc",
+                "travel_time_in_traffic_from_dc",
+                "capacity",
+                "cost_fixed",
+                "cost_operation",
+                "cost_sourcing",
+            ),
+        )
         if df.empty:
             logger.error(f"[ETL] File {PATH_DATA_SATELLITE} is empty")
             sys.exit(1)
-        for _, row in df.iterrows():
-            id_satellite = str(row["id_satellite"])
-
-            cost_fixed = Data.__round_dict_values(json.loads(row["cost_fixed"]))
-            cost_operation = {
+        # column-wise extraction: the JSON parses run over contiguous
+        # object arrays instead of interleaving with per-row access
+        capacities = [json.loads(value) for value in df["capacity"].to_numpy()]
+        costs_fixed = [
+            Data.__round_dict_values(json.loads(value))
+            for value in df["cost_fixed"].to_numpy()
+        ]
+        costs_operation = [
+            {
                 key: Data.__round_list_values(value_list)
-                for key, value_list in json.loads(row["cost_operation"]).items()
+                for key, value_list in json.loads(value).items()
             }
-
-            new_satellite = Satellite(
+            for value in df["cost_operation"].to_numpy()
+        ]
+        rows = zip(
+            df["id_satellite"].astype(str).tolist(),
+            df["lon"].to_numpy(),
+            df["lat"].to_numpy(),
+            df["distance"].to_numpy(),
+            df["travel_time_from_dc"].to_numpy(),
+            df["travel_time_in_traffic_from_dc"].to_numpy(),
+            capacities,
+            costs_fixed,
+            costs_operation,
+            df["cost_sourcing"].to_numpy(),
+        )
+        for (
+            id_satellite,
+            lon,
+            lat,
+            distance,
+            travel_time,
+            travel_time_in_traffic,
+            capacity,
+            cost_fixed,
+            cost_operation,
+            cost_sourcing,
+        ) in rows:
+            satellites[id_satellite] = Satellite(
                 id_satellite=id_satellite,
-                lon=row["lon"],
-                lat=row["lat"],
-                distance_from_dc=row["distance"],
-                travel_time_from_dc=row["travel_time_from_dc"],
-                travel_time_in_traffic_from_dc=row["travel_time_in_traffic_from_dc"],
-                capacity=json.loads(row["capacity"]),
+                lon=lon,
+                lat=lat,
+                distance_from_dc=distance,
+                travel_time_from_dc=travel_time,
+                travel_time_in_traffic_from_dc=travel_time_in_traffic,
+                capacity=capacity,
                 cost_fixed=cost_fixed,
                 cost_operation=cost_operation,
-                cost_sourcing=row["cost_sourcing"],
+                cost_sourcing=cost_sourcing,
             )
-            satellites[id_satellite] = new_satellite
-        if show_data:
+        if show_data and logger.isEnabledFor(logging.INFO):
             for s in satellites.values():
                 logger.info(
-                    "-" * 50 + "\n" + json.dumps(s.__dict__, indent=2, default=str)
+                    "-" * 50 + "\n" + json.dumps(Data.__as_dict(s), indent=2, default=str)
                 )
         # logger.info(f"[ETL] Count of SATELLITES loaded: {len(satellites)}")
         return satellites
@@ -71,79 +139,89 @@ class Data:
         if not os.path.isfile(PATH_DATA_PIXEL):
             logger.error(f"[ETL] File {PATH_DATA_PIXEL} not found")
             sys.exit(1)
-        df = pd.read_excel(PATH_DATA_PIXEL)
+        df = _read_workbook(
+            PATH_DATA_PIXEL,
+            usecols=("id_pixel", "lon", "lat", "area_surface", "speed_intra_stop"),
+        )
         if df.empty:
             logger.error(f"[ETL] File {PATH_DATA_PIXEL} is empty")
             sys.exit(1)
-        for _, row in df.iterrows():
-            id_pixel = str(row["id_pixel"])
-            # create a new pixel
-            new_pixel = Pixel(
+        # column-wise extraction: the JSON parses run over contiguous
+        # object arrays instead of interleaving with per-row access
+        speeds = [json.loads(value) for value in df["speed_intra_stop"].to_numpy()]
+        rows = zip(
+            df["id_pixel"].astype(str).tolist(),
+            df["lon"].to_numpy(),
+            df["lat"].to_numpy(),
+            df["area_surface"].to_numpy(),
+            speeds,
+        )
+        for id_pixel, lon, lat, area_surface, speed_intra_stop in rows:
+            pixels[id_pixel] = Pixel(
                 id_pixel=id_pixel,
-                lon=row["lon"],
-                lat=row["lat"],
-                area_surface=row["area_surface"],
-                speed_intra_stop=json.loads(row["speed_intra_stop"]),
+                lon=lon,
+                lat=lat,
+                area_surface=area_surface,
+                speed_intra_stop=speed_intra_stop,
             )
-            pixels[id_pixel] = new_pixel
-        if show_data:
+        if show_data and logger.isEnabledFor(logging.INFO):
             for p in pixels.values():
                 logger.info(
-                    "-" * 50 + "\n" + json.dumps(p.__dict__, indent=2, default=str)
+                    "-" * 50 + "\n" + json.dumps(Data.__as_dict(p), indent=2, default=str)
                 )
         # logger.info(f"[ETL] Count of PIXELS loaded: {len(pixels)}")
         return pixels
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def load_matrix_from_satellite() -> Dict[str, Dict]:
         """Load data from csv file and create a dictionary of distances and durations"""
         if not os.path.isfile(PATH_DATA_DISTANCES_FROM_SATELLITES):
             logger.error(f"[ETL] File {PATH_DATA_DISTANCES_FROM_SATELLITES} not found")
             sys.exit(1)
-        df = pd.read_excel(PATH_DATA_DISTANCES_FROM_SATELLITES)
+        df = _read_workbook(
+            PATH_DATA_DISTANCES_FROM_SATELLITES,
+            usecols=(
+                "id_satellite",
+                "id_pixel",
+                "distance",
+                "travel_time",
+                "travel_time_in_traffic",
+            ),
+        )
         if df.empty:
             logger.error(f"[ETL] File {PATH_DATA_DISTANCES_FROM_SATELLITES} is empty")
             sys.exit(1)
-        distance = {
-            (row["id_satellite"], row["id_pixel"]): row["distance"]
-            for _, row in df.iterrows()
-        }
-        travel_time = {
-            (row["id_satellite"], row["id_pixel"]): row["travel_time"]
-            for _, row in df.iterrows()
-        }
-        travel_time_in_traffic = {
-            (row["id_satellite"], row["id_pixel"]): row["travel_time_in_traffic"]
-            for _, row in df.iterrows()
-        }
+        # the dict builds run inside pandas instead of a Python row loop;
+        # the MultiIndex yields the same (id_satellite, id_pixel) keys
+        indexed = df.set_index(["id_satellite", "id_pixel"])
         matrix = {
-            "travel_time": travel_time,
-            "distance": distance,
-            "travel_time_in_traffic": travel_time_in_traffic,
+            "travel_time": indexed["travel_time"].to_dict(),
+            "distance": indexed["distance"].to_dict(),
+            "travel_time_in_traffic": indexed["travel_time_in_traffic"].to_dict(),
         }
         return matrix
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def load_matrix_from_dc() -> Dict[str, Dict]:
         """Load data from csv file and create a dictionary of distances and durations"""
         if not os.path.isfile(PATH_DATA_DISTANCES_FROM_DC):
             logger.error(f"[ETL] File {PATH_DATA_DISTANCES_FROM_DC} not found")
             sys.exit(1)
-        df = pd.read_excel(PATH_DATA_DISTANCES_FROM_DC)
+        df = _read_workbook(
+            PATH_DATA_DISTANCES_FROM_DC,
+            usecols=("id_pixel", "distance", "travel_time", "travel_time_in_traffic"),
+        )
         if df.empty:
             logger.error(f"[ETL] File {PATH_DATA_DISTANCES_FROM_DC} is empty")
             sys.exit(1)
-        distance = {(row["id_pixel"]): row["distance"] for _, row in df.iterrows()}
-        travel_time = {
-            (row["id_pixel"]): row["travel_time"] for _, row in df.iterrows()
-        }
-        travel_time_in_traffic = {
-            (row["id_pixel"]): row["travel_time_in_traffic"] for _, row in df.iterrows()
-        }
+        # the dict builds run inside pandas instead of a Python row loop
+        indexed = df.set_index("id_pixel")
         matrix = {
-            "travel_time": travel_time,
-            "distance": distance,
-            "travel_time_in_traffic": travel_time_in_traffic,
+            "travel_time": indexed["travel_time"].to_dict(),
+            "distance": indexed["distance"].to_dict(),
+            "travel_time_in_traffic": indexed["travel_time_in_traffic"].to_dict(),
         }
         return matrix
 
@@ -155,28 +233,40 @@ class Data:
         if not os.path.isfile(scenario_path):
             logger.error(f"[ETL] File {scenario_path} not found")
             sys.exit(1)
-        df = pd.read_excel(scenario_path)
+        df = _read_workbook(
+            scenario_path,
+            usecols=(
+                "id_pixel",
+                "demand_by_period",
+                "drop_by_period",
+                "stop_by_period",
+            ),
+        )
         if df.empty:
             logger.error(f"[ETL] File {scenario_path} is empty")
             sys.exit(1)
 
         pixels = {}
-        for _, row in df.iterrows():
-            id_pixel = str(row["id_pixel"])
-            demand_by_period = json.loads(row["demand_by_period"])
-            drop_by_period = json.loads(row["drop_by_period"])
-            stop_by_period = json.loads(row["stop_by_period"])
+        # column-wise extraction: the JSON parses run over contiguous
+        # object arrays instead of interleaving with per-row access
+        rows = zip(
+            df["id_pixel"].astype(str).tolist(),
+            [json.loads(value) for value in df["demand_by_period"].to_numpy()],
+            [json.loads(value) for value in df["drop_by_period"].to_numpy()],
+            [json.loads(value) for value in df["stop_by_period"].to_numpy()],
+        )
+        for id_pixel, demand_by_period, drop_by_period, stop_by_period in rows:
             pixel = base_pixels.get(id_pixel, None)
             if not pixel is None:
                 # update the demand by period
-                pixel.demand_by_period = demand_by_period
-                pixel.stop_by_period = stop_by_period
-                pixel.drop_by_period = drop_by_period
+                pixel.demand_by_period = np.asarray(demand_by_period, dtype=np.float64)
+                pixel.stop_by_period = np.asarray(stop_by_period, dtype=np.float64)
+                pixel.drop_by_period = np.asarray(drop_by_period, dtype=np.float64)
                 pixels[id_pixel] = pixel
-        if show_data:
+        if show_data and logger.isEnabledFor(logging.INFO):
             for p in pixels.values():
                 logger.info(
-                    "-" * 50 + "\n" + json.dumps(p.__dict__, indent=2, default=str)
+                    "-" * 50 + "\n" + json.dumps(Data.__as_dict(p), indent=2, default=str)
                 )  # pylint: disable=no-member
         # logger.info(
         #     f"[ETL] Count of PIXELS loaded from instances: {len(pixels)} - scenario {id_scenario}" # pylint: disable=line-too-long
@@ -186,23 +276,25 @@ class Data:
     @staticmethod
     def load_vehicles() -> Dict[str, Vehicle]:
         """Load data from csv file and create a dictionary of distances and durations"""
-        vehicle_large = Vehicle(
-            **LARGE_CONFIG,
-        )
-        vehicle_small = Vehicle(
-            **SMALL_CONFIG,
-        )
         # logger.info(
         #     f"[ETL] Quantity of vehicles loaded: {len([vehicle_small, vehicle_large])}" # pylint: disable=line-too-long
         # )
-        return {"small": vehicle_small, "large": vehicle_large}
+        return {"small": _build_vehicle("small"), "large": _build_vehicle("large")}
 
     @staticmethod
     def __round_dict_values(dict_to_round: Dict) -> Dict:
         """Round the values of a dictionary"""
-        return {k: round(v, 0) for k, v in dict_to_round.items()}
+        values = np.rint(np.fromiter(dict_to_round.values(), dtype=np.float64))
+        return dict(zip(dict_to_round.keys(), values.tolist()))
 
     @staticmethod
     def __round_list_values(list_to_round: list) -> list:
         """Round the values of a list"""
-        return [round(v, 0) for v in list_to_round]
+        return np.rint(np.asarray(list_to_round, dtype=np.float64)).tolist()
+
+
+@lru_cache(maxsize=None)
+def _build_vehicle(kind: str) -> Vehicle:
+    """Build the shared Vehicle of the given kind once."""
+    config = SMALL_CONFIG if kind == "small" else LARGE_CONFIG
+    return Vehicle(**config)
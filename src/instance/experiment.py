@@ -1,11 +1,109 @@
 """Module of instance generator."""
 import itertools
-from typing import Any, Dict, List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, partial
+from typing import Any, Dict, List, Tuple
 
 from src.instance.instance import Instance
 from src.utils import LOGGER as logger
 
 
+def _build_experiment(
+    N_evaluation: int,
+    M: int,
+    include_expected: bool,
+    debug: bool,
+    indexed_combination: Tuple[int, Tuple],
+) -> Dict[str, Any]:
+    """Build the train/evaluation instances of one combination.
+
+    Module-level so worker processes can pickle it; the per-process ETL
+    caches keep each worker at one parse of the spreadsheets.
+    """
+    index, combination = indexed_combination
+    (
+        N,
+        capacity_satellites,
+        is_continuous_x,
+        type_of_flexibility,
+        alpha,
+        beta,
+    ) = combination
+    # training instances
+    instances_train = {}
+    for m in range(M):
+        id_instance = f"id_{index}_M_{m}_train"
+        logger.info(
+            "[EXPERIMENT] Generating instance %s - combination %s",
+            id_instance,
+            combination,
+        )
+        instance = Instance(
+            id_instance=id_instance,
+            capacity_satellites=capacity_satellites,
+            is_continuous_x=is_continuous_x,
+            alpha=alpha,
+            beta=beta,
+            type_of_flexibility=type_of_flexibility,
+            periods=12,
+            N=N,
+            is_evaluation=False,
+        )
+        if debug:
+            logger.info(
+                "[EXPERIMENT] Instance training %s \n %s", id_instance, instance
+            )
+        instances_train[id_instance] = instance
+    logger.info(
+        "[EXPERIMENT] Generated %s instances for training - M %s",
+        len(instances_train),
+        M,
+    )
+    if include_expected:
+        # expected instances
+        id_instance = f"id_{index}_expected"
+        instance_expected = Instance(
+            id_instance=id_instance,
+            capacity_satellites=capacity_satellites,
+            is_continuous_x=is_continuous_x,
+            alpha=alpha,
+            beta=beta,
+            type_of_flexibility=type_of_flexibility,
+            periods=12,
+            N=N_evaluation,
+            is_evaluation=True,
+        )
+        # set scenario expected
+        instance_expected.scenarios = {
+            "expected": instance_expected.get_scenario_expected()
+        }
+        instances_train[id_instance] = instance_expected
+
+    # evaluation instances
+    id_instance = f"id_{index}_testing"
+    instance_evaluation = Instance(
+        id_instance=id_instance,
+        capacity_satellites=capacity_satellites,
+        is_continuous_x=is_continuous_x,
+        alpha=alpha,
+        beta=beta,
+        type_of_flexibility=type_of_flexibility,
+        periods=12,
+        N=N_evaluation,
+        is_evaluation=True,
+    )
+    if debug:
+        logger.info(
+            "[EXPERIMENT] Instance testing %s \n %s", id_instance, instance_evaluation
+        )
+
+    return {
+        "instances_train": instances_train,
+        "instance_evaluation": instance_evaluation,
+    }
+
+
 class Experiment:
     """Class to generate instances."""
 
@@ -13,28 +111,38 @@ class Experiment:
         self.N_evaluation = N_evaluation
         self.M = M
         self.folder_path = folder_path
+        self._combinations: Tuple = None
 
-    def __get_combinations(self) -> itertools.product:
-        """Return a list of combinations"""
-        N = [5 * i for i in range(1, 11)]
-        capacity_satellites = [
-            {"2": 2, "6": 6, "12": 12},
-            {"2": 2, "6": 6, "8": 8, "12": 12},
-            {"2": 2, "4": 4, "6": 6, "8": 8, "10": 10, "12": 12},
-        ]
-        is_continuous_x = [True, False]
-        type_of_flexibility = [1, 2]
-        alpha = [1.0]
-        beta = [1.0]
-        return itertools.product(
-            N, capacity_satellites, is_continuous_x, type_of_flexibility, alpha, beta
-        )
+    def __get_combinations(self) -> Tuple:
+        """Return the combinations, materialized once and reused."""
+        if self._combinations is None:
+            N = [5 * i for i in range(1, 11)]
+            capacity_satellites = [
+                {"2": 2, "6": 6, "12": 12},
+                {"2": 2, "6": 6, "8": 8, "12": 12},
+                {"2": 2, "4": 4, "6": 6, "8": 8, "10": 10, "12": 12},
+            ]
+            is_continuous_x = [True, False]
+            type_of_flexibility = [1, 2]
+            alpha = [1.0]
+            beta = [1.0]
+            self._combinations = tuple(
+                itertools.product(
+                    N,
+                    capacity_satellites,
+                    is_continuous_x,
+                    type_of_flexibility,
+                    alpha,
+                    beta,
+                )
+            )
+        return self._combinations
 
-    def get_info_combinations(self) -> List[Dict[str, Any]]:
-        """Return a list of combinations"""
-        combinations = self.__get_combinations()
+    @cached_property
+    def info_combinations(self) -> List[Dict[str, Any]]:
+        """Information of the combinations, computed once and cached."""
         info_combinations = []
-        for combination in combinations:
+        for combination in self.__get_combinations():
             (
                 N,
                 capacity_satellites,
@@ -58,98 +166,35 @@ class Experiment:
             )
         return info_combinations
 
+    def get_info_combinations(self) -> List[Dict[str, Any]]:
+        """Return a list of combinations"""
+        return self.info_combinations
+
     def generate_instances(
         self, include_expected: bool, debug: bool = False
     ) -> List[Dict[str, Any]]:
         """Generate instances for training and evaluation. Return a list of instances."""
         combinations = self.__get_combinations()
-        n_combinations = len(list(self.__get_combinations()))
+        n_combinations = len(combinations)
+        build = partial(
+            _build_experiment, self.N_evaluation, self.M, include_expected, debug
+        )
+        # each combination is independent: build them in worker processes
+        # and collect in submission order so the result stays deterministic
         experiments = []
-        index = 0
-        for combination in combinations:
-            # training instances
-            instances_train = {}
-            (
-                N,
-                capacity_satellites,
-                is_continuous_x,
-                type_of_flexibility,
-                alpha,
-                beta,
-            ) = combination
-            for m in range(self.M):
-                id_instance = f"id_{index}_M_{m}_train"
-                logger.info(
-                    f"[EXPERIMENT] Generating instance {id_instance} - combination {combination}"
-                )
-                instance = Instance(
-                    id_instance=id_instance,
-                    capacity_satellites=capacity_satellites,
-                    is_continuous_x=is_continuous_x,
-                    alpha=alpha,
-                    beta=beta,
-                    type_of_flexibility=type_of_flexibility,
-                    periods=12,
-                    N=N,
-                    is_evaluation=False,
-                )
-                if debug:
-                    logger.info(
-                        f"[EXPERIMENT] Instance training {id_instance} \n {instance}"
-                    )
-                instances_train[id_instance] = instance
-            logger.info(
-                f"[EXPERIMENT] Generated {len(instances_train)} instances for training - M {self.M}"
-            )
-            if include_expected:
-                # expected instances
-                id_instance = f"id_{index}_expected"
-                instance_expected = Instance(
-                    id_instance=id_instance,
-                    capacity_satellites=capacity_satellites,
-                    is_continuous_x=is_continuous_x,
-                    alpha=alpha,
-                    beta=beta,
-                    type_of_flexibility=type_of_flexibility,
-                    periods=12,
-                    N=self.N_evaluation,
-                    is_evaluation=True,
-                )
-                # set scenario expected
-                instance_expected.scenarios = {
-                    "expected": instance_expected.get_scenario_expected()
-                }
-                instances_train[id_instance] = instance_expected
-
-            # evaluation instances
-            id_instance = f"id_{index}_testing"
-            instance_evaluation = Instance(
-                id_instance=id_instance,
-                capacity_satellites=capacity_satellites,
-                is_continuous_x=is_continuous_x,
-                alpha=alpha,
-                beta=beta,
-                type_of_flexibility=type_of_flexibility,
-                periods=12,
-                N=self.N_evaluation,
-                is_evaluation=True,
-            )
-            if debug:
+        with ProcessPoolExecutor(
+            max_workers=max(1, os.cpu_count() // 2)
+        ) as executor:
+            for index, experiment in enumerate(
+                executor.map(build, enumerate(combinations)), start=1
+            ):
+                experiments.append(experiment)
                 logger.info(
-                    f"[EXPERIMENT] Instance testing {id_instance} \n {instance_evaluation}"
+                    "[EXPERIMENT] Generated instance %s of %s combinations",
+                    index,
+                    n_combinations,
                 )
-
-            experiments.append(
-                {
-                    "instances_train": instances_train,
-                    "instance_evaluation": instance_evaluation,
-                }
-            )
-            index += 1
-            logger.info(
-                f"[EXPERIMENT] Generated instance {index} of {n_combinations} combinations"
-            )
-        logger.info(f"[EXPERIMENT] Generated {len(experiments)} experiments")
+        logger.info("[EXPERIMENT] Generated %s experiments", len(experiments))
         return experiments
 
 
@@ -2,6 +2,8 @@
 import json
 import os
 import random
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Dict, List
 
 from src.classes import Pixel, Satellite, Vehicle
@@ -11,13 +13,43 @@ from src.continuous_approximation.continuous_approximation import (
 )
 from src.continuous_approximation.fleet_size import (
     ContinuousApproximationConfig,
-    get_cost_from_continuous_approximation,
+    compute_fleet_size_and_costs,
 )
 from src.etl import Data
 from src.instance.scenario import Scenario
 from src.utils import LOGGER as logger
 
 
+class _LazyScenarios(Mapping):
+    """Mapping of scenario id to Scenario, built on first access.
+
+    Callers that replace the scenarios (expected-value runs) or touch
+    only a subset never pay for building the full sample; iteration
+    still materializes each scenario exactly once and caches it.
+    """
+
+    def __init__(self, instance: "Instance", id_scenarios_sample: List[int]):
+        self._instance = instance
+        self._ids = {
+            str(id_scenario): id_scenario for id_scenario in id_scenarios_sample
+        }
+        self._computed: Dict[str, Scenario] = {}
+
+    def __getitem__(self, key) -> Scenario:
+        key = str(key)
+        scenario = self._computed.get(key)
+        if scenario is None:
+            scenario = self._instance._build_scenario(self._ids[key])
+            self._computed[key] = scenario
+        return scenario
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
 class Instance:
     """Class to define Instance"""
 
@@ -50,6 +82,8 @@ class Instance:
 
         # read the data
         self.satellites: Dict[str, Satellite] = self.__read_satellites()
+        # distance matrixes read once and shared by every scenario
+        self.distances_line_haul: Dict[str, Dict] = self.__read_distances()
 
         # continuous approximation
         self.computer_fleet_size = (
@@ -62,15 +96,12 @@ class Instance:
             else ContinuousApproximation(
                 periods=periods,
                 satellites=self.satellites,
-                matrixes={
-                    "dc": Data.load_matrix_from_dc()["distance"],
-                    "satellite": Data.load_matrix_from_satellite()["distance"],
-                },
+                matrixes=self.distances_line_haul,
                 vehicles=self.vehicles,
             )
         )
         self.type_of_cost_serving = type_of_cost_serving
-        self.scenarios: Dict[str, Scenario] = self.__compute_scenarios()
+        self.scenarios: Mapping = self.__compute_scenarios()
         self.__update_satellites()
 
     def __str__(self):
@@ -91,8 +122,9 @@ class Instance:
             f"-----------------"
         )
 
-    def get_info(self) -> Dict:
-        """Get the information of the instance."""
+    @cached_property
+    def info(self) -> Dict:
+        """Information of the instance, computed once and cached."""
         return {
             "id_instance": self.id_instance,
             "capacity_satellites": self.capacity_satellites,
@@ -108,6 +140,10 @@ class Instance:
             "quantity_scenarios": len(self.scenarios),
         }
 
+    def get_info(self) -> Dict:
+        """Get the information of the instance."""
+        return self.info
+
     def __update_satellites(self) -> None:
         """Update the satellites."""
         for satellite in self.satellites.values():
@@ -131,6 +167,18 @@ class Instance:
             raise error
         return vehicles
 
+    def __read_distances(self) -> Dict[str, Dict]:
+        """Reads the distance matrixes from the files."""
+        try:
+            distances = {
+                "dc": Data.load_matrix_from_dc()["distance"],
+                "satellite": Data.load_matrix_from_satellite()["distance"],
+            }
+        except FileNotFoundError as error:
+            logger.error(f"[read distances] File not found: {error}")
+            raise error
+        return distances
+
     def __read_pixels(self, id_scenario: int) -> Dict[str, Pixel]:
         """Reads the pixels from the file."""
         try:
@@ -140,115 +188,59 @@ class Instance:
             raise error
         return pixels
 
-    def __calculate_fleet_size_required(self, pixels: Pixel) -> Dict[str, Dict]:
-        """Calculates the fleet size required for the instance."""
-        try:
-            matrix_satellite_pixels = Data.load_matrix_from_satellite()
-            matrix_dc_pixels = Data.load_matrix_from_dc()
-
-            # compute fleet size required from satellite to pixel
-            if self.type_of_cost_serving == 1:
-                fleet_size_from_satellites = (
-                    self.computer_fleet_size.calculate_avg_fleet_size_from_satellites(
-                        pixels=pixels,
-                        distances_line_haul=matrix_satellite_pixels["distance"],
-                        satellites=self.satellites,
-                    )
-                )
-                fleet_size_from_dc = (
-                    self.computer_fleet_size.calculate_avg_fleet_size_from_dc(
-                        pixels=pixels,
-                        distances_line_haul=matrix_dc_pixels["distance"],
-                    )
-                )
-            else:
-                fleet_size_from_satellites = (
-                    self.computer_fleet_size.get_average_fleet_size(pixels, "satellite")
-                )
-                fleet_size_from_dc = self.computer_fleet_size.get_average_fleet_size(
-                    pixels, "dc"
-                )
-        except FileNotFoundError as error:
-            logger.error(f"[calculate fleet size required] File not found: {error}")
-            raise error
-        fleet_size_required = {
-            "satellite": fleet_size_from_satellites,
-            "dc": fleet_size_from_dc,
-        }
-        return fleet_size_required
-
     def __get_scenarios_sample(self) -> List[int]:
         """Get the scenarios for sample."""
         # validate if the file exists
         path_json = PATH_SAMPLING_SCENARIO + f"instance_{self.id_instance}.json"
-        id_scenarios_sample = []
-        if os.path.exists(path_json) and self.is_evaluation:
+        if os.path.exists(path_json):
             with open(path_json, "r") as file:
                 data = json.load(file)
-                id_scenarios_sample = data["id_scenarios_sample"]
-        else:
-            id_scenarios_sample = random.sample(range(500), self.N)
-            with open(path_json, "w") as file:
-                json.dump({"id_scenarios_sample": id_scenarios_sample}, file)
+                return data["id_scenarios_sample"]
+        # seeded by the instance id so reruns draw the same sample
+        id_scenarios_sample = random.Random(self.id_instance).sample(
+            range(500), self.N
+        )
+        with open(path_json, "w") as file:
+            json.dump({"id_scenarios_sample": id_scenarios_sample}, file)
         return id_scenarios_sample
 
-    def __calculate_costs(
-        self, pixels: Pixel, fleet_size_required: Dict[str, Dict]
+    def __calculate_costs_and_fleet_size(
+        self, pixels: Dict[str, Pixel]
     ) -> Dict[str, Dict]:
-        """Calculates the costs of the instance."""
-        try:
-            matrix_satellite_pixels = Data.load_matrix_from_satellite()
-            matrix_dc_pixels = Data.load_matrix_from_dc()
-
-            if self.type_of_cost_serving == 1:
-                costs = get_cost_from_continuous_approximation(
-                    pixels=pixels,
-                    satellites=self.satellites,
-                    vehicles=self.vehicles,
-                    periods=self.periods,
-                    fleet_size_required=fleet_size_required,
-                    distance_line_haul={
-                        "satellite": matrix_satellite_pixels["distance"],
-                        "dc": matrix_dc_pixels["distance"],
-                    },
-                )
-            else:
-                costs = {
-                    "dc": self.computer_fleet_size.get_cost_serve_pixel(pixels, "dc"),
-                    "satellite": self.computer_fleet_size.get_cost_serve_pixel(
-                        pixels, "satellite"
-                    ),
-                }
-        except Exception as error:
-            logger.error(f"[calculate costs] File not found: {error}")
-            raise error
-        return costs
-
-    def __compute_scenarios(self) -> Dict[str, Scenario]:
-        """Computes the scenarios."""
-        id_scenarios_sample = self.__get_scenarios_sample()
-        logger.info(f"Scenarios sample: {id_scenarios_sample}")
-        scenarios = {}
-        for id_scenario in id_scenarios_sample:
-            pixels = self.__read_pixels(id_scenario)
-            fleet_size_required = self.__calculate_fleet_size_required(pixels)
-            costs_from_ca = self.__calculate_costs(pixels, fleet_size_required)
-            scenario = Scenario(
-                id_scenario=id_scenario,
+        """Calculates serving costs and fleet size required in one pass."""
+        if self.type_of_cost_serving == 1:
+            costs, fleet_size_required = compute_fleet_size_and_costs(
+                computer=self.computer_fleet_size,
+                satellites=self.satellites,
                 pixels=pixels,
-                costs=costs_from_ca,
-                fleet_size_required=fleet_size_required,
+                vehicles=self.vehicles,
+                distance_line_haul=self.distances_line_haul,
                 periods=self.periods,
             )
-            scenarios[str(id_scenario)] = scenario
-        return scenarios
+            return costs, fleet_size_required
+        costs_dc, fleet_size_dc = self.computer_fleet_size.get_all(pixels, "dc")
+        costs_satellite, fleet_size_satellite = self.computer_fleet_size.get_all(
+            pixels, "satellite"
+        )
+        costs = {"dc": costs_dc, "satellite": costs_satellite}
+        fleet_size_required = {
+            "dc": fleet_size_dc,
+            "satellite": fleet_size_satellite,
+        }
+        return costs, fleet_size_required
 
-    def get_scenario_expected(self) -> Scenario:
-        """Get the expected scenario."""
-        id_scenario = "expected"
+    def __compute_scenarios(self) -> "_LazyScenarios":
+        """Defers scenario construction until first access."""
+        id_scenarios_sample = self.__get_scenarios_sample()
+        logger.info(f"Scenarios sample: {id_scenarios_sample}")
+        return _LazyScenarios(self, id_scenarios_sample)
+
+    def _build_scenario(self, id_scenario) -> Scenario:
+        """Builds a single scenario; called on demand by the scenarios mapping."""
         pixels = self.__read_pixels(id_scenario)
-        fleet_size_required = self.__calculate_fleet_size_required(pixels)
-        costs_from_ca = self.__calculate_costs(pixels, fleet_size_required)
+        costs_from_ca, fleet_size_required = self.__calculate_costs_and_fleet_size(
+            pixels
+        )
         scenario = Scenario(
             id_scenario=id_scenario,
             pixels=pixels,
@@ -258,6 +250,10 @@ class Instance:
         )
         return scenario
 
+    def get_scenario_expected(self) -> Scenario:
+        """Get the expected scenario."""
+        return self._build_scenario("expected")
+
 
 # if __name__ == "__main__":
 #     insta = Instance(
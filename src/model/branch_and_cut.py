@@ -27,6 +27,18 @@ class Branch_and_Cut:
         self.satellites: Dict[str, Satellite] = instance.satellites
         self.scenarios: Dict[str, Scenario] = instance.scenarios
         self.periods = instance.periods
+        # flattened (s, q) pairs and their fixed costs for pricing a
+        # solution with one dot product in solve_evaluation
+        self._sq_pairs = [
+            (s, q)
+            for s, satellite in instance.satellites.items()
+            for q in satellite.capacity.keys()
+        ]
+        self._cost_fixed = np.fromiter(
+            (instance.satellites[s].cost_fixed[q] for s, q in self._sq_pairs),
+            dtype=np.float64,
+            count=len(self._sq_pairs),
+        )
 
         # config params
         self.objective_value = 0
@@ -35,6 +47,44 @@ class Branch_and_Cut:
         self.optimality_gap = 0
         self.best_bound_value = 0
 
+        # incumbent kept across instances for warm starting
+        self.previous_solution: Dict[Any, float] = {}
+
+    def reset_for_instance(self, instance: Instance) -> None:
+        """Reuse the solver for a new instance instead of constructing a new one.
+
+        Only the instance-dependent state is rebuilt; the incumbent of the
+        previous solve is kept so it can be used as MIP start when
+        `solve` is called with `warm_start=True`.
+        """
+        # release the previous Gurobi model before building the next one
+        if getattr(self.MP, "model", None) is not None:
+            self.MP.model.dispose()
+
+        self.MP = MasterProblem(instance)
+        self.Cuts = Cuts(instance, self.MP.LB)
+
+        self.instance = instance
+        self.satellites = instance.satellites
+        self.scenarios = instance.scenarios
+        self.periods = instance.periods
+        self._sq_pairs = [
+            (s, q)
+            for s, satellite in instance.satellites.items()
+            for q in satellite.capacity.keys()
+        ]
+        self._cost_fixed = np.fromiter(
+            (instance.satellites[s].cost_fixed[q] for s, q in self._sq_pairs),
+            dtype=np.float64,
+            count=len(self._sq_pairs),
+        )
+
+        self.objective_value = 0
+        self.initial_upper_bound = 0
+        self.run_time = 0
+        self.optimality_gap = 0
+        self.best_bound_value = 0
+
     def solve(self, max_run_time: int, warm_start: bool = False) -> None:
         """Solve the Branch and Cut algorithm"""
         # (1) Create master problem:
@@ -53,6 +103,12 @@ class Branch_and_Cut:
         self.MP.model.setParam("MIPGap", 0.001)
         self.MP.model.setParam("Threads", 10)
 
+        # reuse the incumbent of the previous instance as MIP start
+        if warm_start and self.previous_solution:
+            for key, value in self.previous_solution.items():
+                if key in self.MP.Y:
+                    self.MP.Y[key].Start = round(value)
+
         start_time = time.time()
         self.MP.set_start_time(start_time)
         self.Cuts.set_start_time(start_time)
@@ -74,6 +130,7 @@ class Branch_and_Cut:
             self.run_time = round(time.time() - start_time, 3)
             self.optimality_gap = round(100 * self.MP.model.MIPGap, 3)
             self.objective_value = round(self.MP.get_objective_value(), 3)
+            self.previous_solution = dict(self.Cuts.best_solution)
         except AttributeError:
             logger.error(
                 "[BRANCH AND CUT] Error while saving metrics - id instance: %s",
@@ -114,13 +171,12 @@ class Branch_and_Cut:
     def solve_evaluation(self, solution: Dict[Any, float]) -> float:
         """Solve the subproblem for the evaluation"""
         # (1) compute cost installed satellites
-        cost_installed_satellites = np.sum(
-            [
-                satellite.cost_fixed[q] * solution[(s, q)]
-                for s, satellite in self.satellites.items()
-                for q in satellite.capacity.keys()
-            ]
+        solution_values = np.fromiter(
+            (solution[s_q] for s_q in self._sq_pairs),
+            dtype=np.float64,
+            count=len(self._sq_pairs),
         )
+        cost_installed_satellites = float(self._cost_fixed @ solution_values)
 
         # (2) create subproblem N * T times and solve
         cost_second_echeleon = 0
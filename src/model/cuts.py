@@ -1,6 +1,8 @@
 """Module to define Sub Problem and Cut Generator"""
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 import numpy as np
@@ -16,6 +18,9 @@ from src.utils import LOGGER as logger
 class Cuts:
     """Class to define the Cut Generator"""
 
+    # bound on memoized subproblem costs kept across callbacks
+    SP_CACHE_SIZE = 10_000
+
     def __init__(self, instance: Instance, lower_bound_from_mp: Dict[Any, float]):
         # solver SP
         Cuts.SPs: Dict[Any, SubProblem] = self.__create_subproblems(instance)
@@ -25,6 +30,26 @@ class Cuts:
         Cuts.periods: int = instance.periods
         Cuts.satellites: Dict[str, Satellite] = instance.satellites
         Cuts.instance = instance
+        # flattened (s, q) pairs so the callbacks iterate one list
+        # instead of walking the satellites and capacities per call
+        Cuts._sq_pairs = [
+            (s, q)
+            for s, satellite in instance.satellites.items()
+            for q in satellite.capacity.keys()
+        ]
+        # subproblem costs memoized by (scenario, active satellite set):
+        # branch and cut revisits the same integer Y across nodes
+        Cuts._sp_cache: Dict[Any, float] = {}
+        # fixed installation costs aligned with _sq_pairs, so the
+        # callback prices a solution with one dot product
+        Cuts._cost_fixed = np.fromiter(
+            (
+                instance.satellites[s].cost_fixed[q]
+                for s, q in Cuts._sq_pairs
+            ),
+            dtype=np.float64,
+            count=len(Cuts._sq_pairs),
+        )
 
         # configs parameters
         Cuts.optimality_cuts = 0
@@ -50,29 +75,48 @@ class Cuts:
         Y = model.cbGetSolution(model._Y)
         θ = model.cbGetSolution(model._θ)
 
-        # solve subproblems
-        total_subproblem_cost = 0
+        # reuse memoized costs when this active satellite set was
+        # already evaluated for a scenario at an earlier node
+        active_set = frozenset(s_q for s_q in Cuts._sq_pairs if Y[s_q] > 0.5)
+        id_scenarios = list(Cuts.instance.scenarios.keys())
         new_θ = {}
-        for n in Cuts.instance.scenarios.keys():
+        for n in id_scenarios:
+            cached_cost = Cuts._sp_cache.get((n, active_set))
+            if cached_cost is not None:
+                new_θ[n] = cached_cost
+        pending = [n for n in id_scenarios if n not in new_θ]
+
+        # solve subproblems: each scenario model is independent given Y
+        # and Gurobi releases the GIL while optimizing, so the solves run
+        # on a thread pool; the cuts below are still applied serially
+        def solve(n):
             logger.info(f"[CUT] Subproblem: {n}")
-            subproblem_runtime, subproblem_cost = Cuts.SPs[n].solve_model(
-                Y, False
-            )
+            return n, Cuts.SPs[n].solve_model(Y, False)
+
+        results = []
+        if pending:
+            workers = min(len(pending), max(1, (os.cpu_count() or 2) // 2))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(solve, pending))
+
+        for n, (subproblem_runtime, subproblem_cost) in results:
             Cuts.subproblem_solved += 1
             new_θ[n] = subproblem_cost
-            total_subproblem_cost += subproblem_cost
             Cuts.run_times.append(subproblem_runtime)
+            if len(Cuts._sp_cache) >= Cuts.SP_CACHE_SIZE:
+                Cuts._sp_cache.pop(next(iter(Cuts._sp_cache)))
+            Cuts._sp_cache[(n, active_set)] = subproblem_cost
+        total_subproblem_cost = sum(new_θ[n] for n in id_scenarios)
 
         logger.info(f"[CUT] Subproblems solved: {Cuts.subproblem_solved}")
 
+        y_values = np.fromiter(
+            (Y[s_q] for s_q in Cuts._sq_pairs),
+            dtype=np.float64,
+            count=len(Cuts._sq_pairs),
+        )
         total_cost = (
-            np.sum(
-                [
-                    satellite.cost_fixed[q] * Y[(s, q)]
-                    for s, satellite in Cuts.instance.satellites.items()
-                    for q in satellite.capacity.keys()
-                ]
-            )
+            float(Cuts._cost_fixed @ y_values)
             + (1 / (len(Cuts.instance.scenarios))) * total_subproblem_cost
         )
 
@@ -86,11 +130,12 @@ class Cuts:
             model.cbSetSolution(model._θ, new_θ)
             model.cbUseSolution()
 
-        # add optimality cuts
+        # add optimality cuts: the activation function only depends on Y,
+        # so it is built once and shared by every scenario cut
         epsilon = 1e-6
+        act_function = Cuts.get_activation_function(model, Y)
         for n in Cuts.instance.scenarios.keys():
             if θ[n] < new_θ[n] + epsilon:
-                act_function = Cuts.get_activation_function(model, Y)
                 model.cbLazy(
                     model._θ[n]
                     >= (
@@ -105,27 +150,18 @@ class Cuts:
     def get_activation_function(model, Y):
         """Get the activation function"""
         epsilon = 1e-6
+        # partition the pairs in a single scan instead of three
+        actives = []
+        inactives = []
+        for s_q in Cuts._sq_pairs:
+            if Y[s_q] + epsilon >= 1:
+                actives.append(s_q)
+            elif Y[s_q] < 0.5:
+                inactives.append(s_q)
         activation = (
-            quicksum(
-                model._Y[(s, q)]
-                for s, satellite in Cuts.satellites.items()
-                for q in satellite.capacity.keys()
-                if Y[(s, q)] + epsilon >= 1
-            )
-            - quicksum(
-                model._Y[(s, q)]
-                for s, satellite in Cuts.satellites.items()
-                for q in satellite.capacity.keys()
-                if Y[(s, q)] < 0.5
-            )
-            - np.sum(
-                [
-                    1
-                    for s, satellite in Cuts.satellites.items()
-                    for q in satellite.capacity.keys()
-                    if Y[(s, q)] + epsilon >= 1
-                ]
-            )
+            quicksum(model._Y[s_q] for s_q in actives)
+            - quicksum(model._Y[s_q] for s_q in inactives)
+            - len(actives)
         )
         return activation
 
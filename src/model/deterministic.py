@@ -20,12 +20,10 @@ class FlexibilityModel:
         self.periods: int = instance.periods
         self.satellites: Dict[str, Satellite] = instance.satellites
         self.pixels: Dict[str, Pixel] = instance.scenarios[id_scenario].pixels
-        self.cost_serving: Dict[str, Dict] = instance.scenarios[
-            id_scenario
-        ].get_cost_serving()
+        self.cost_serving: Dict[str, Dict] = instance.scenarios[id_scenario].costs
         self.fleet_size_required: Dict[str, Dict] = instance.scenarios[
             id_scenario
-        ].get_fleet_size_required()
+        ].fleet_size_required
 
         # Params from instance
         self.type_of_flexibility: int = instance.type_of_flexibility
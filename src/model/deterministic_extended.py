@@ -165,7 +165,7 @@ class FlexibilityModelExtended:
         # 3. add cost served from satellite
         self.cost_served_from_satellite = quicksum(
             [
-                scenario.get_cost_serving("satellite")[(s, k, t)]["total"]
+                scenario.costs["satellite"][(s, k, t)]["total"]
                 * self.X[(s, k, n, t)]
                 for s in satellites.keys()
                 for n, scenario in scenarios.items()
@@ -177,7 +177,7 @@ class FlexibilityModelExtended:
         # 4. add cost served from dc
         self.cost_served_from_dc = quicksum(
             [
-                scenario.get_cost_serving("dc")[(k, t)]["total"] * self.W[(k, n, t)]
+                scenario.costs["dc"][(k, t)]["total"] * self.W[(k, n, t)]
                 for n, scenario in scenarios.items()
                 for k in scenario.pixels.keys()
                 for t in range(self.periods)
@@ -279,7 +279,7 @@ class FlexibilityModelExtended:
             for s, satellite in satellites.items():
                 for n, scenario in scenarios.items():
                     pixels = scenario.pixels
-                    fleet_size_required = scenario.get_fleet_size_required("satellite")
+                    fleet_size_required = scenario.fleet_size_required["satellite"]
                     nameConstraint = f"R_capacity_s{s}_n{n}_t{t}"
                     if self.type_of_flexibility == 2:
                         self.model.addConstr(
@@ -82,14 +82,16 @@ class MasterProblem:
         LB = {}
         logger.info("[MODEL] Computing lower bounds for the second stage cost")
         for n, scenario in self.scenarios.items():
+            costs_satellite = scenario.costs["satellite"]
+            costs_dc = scenario.costs["dc"]
             LB[n] = np.sum(
                 [
                     np.min(
                         [
-                            scenario.get_cost_serving("satellite")[(s, k, t)]["total"]
+                            costs_satellite[(s, k, t)]["total"]
                             for s in self.satellites.keys()
                         ]
-                        + [scenario.get_cost_serving("dc")[(k, t)]["total"]]
+                        + [costs_dc[(k, t)]["total"]]
                     )
                     for k in scenario.pixels.keys()
                     for t in range(self.periods)
@@ -188,4 +190,6 @@ class MasterProblem:
     def get_y_solution(self):
         """Get the Y solution of the model."""
         logger.info("[MODEL] Getting Y solution")
-        return {str(keys): value.X for keys, value in self.Y.items()}
+        # batch attribute getter: one native call instead of one per variable
+        values = self.model.getAttr("X", list(self.Y.values()))
+        return dict(zip(map(str, self.Y.keys()), values))
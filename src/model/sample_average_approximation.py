@@ -33,12 +33,18 @@ class SampleAverageApproximation:
 
         # (1) Train the model
         best_solutions: List[Dict[Any, float]] = []
+        branch_and_cut: Branch_and_Cut = None
         for n, instance in instances_train.items():
             print(
                 f"[SAA] ID experiment {self.id_experiment} -  Train model for instance {n}"
             )
-            branch_and_cut: Branch_and_Cut = self.__create_branch_and_cut(instance)
-            branch_and_cut.solve(max_run_time=3600, warm_start=False)
+            # reuse a single solver across instances and warm start it
+            # with the incumbent of the previous one
+            if branch_and_cut is None:
+                branch_and_cut = self.__create_branch_and_cut(instance)
+            else:
+                branch_and_cut.reset_for_instance(instance)
+            branch_and_cut.solve(max_run_time=3600, warm_start=True)
             current_solution: Dict[
                 str, float
             ] = branch_and_cut.get_best_solution_allocation()
@@ -61,10 +67,12 @@ class SampleAverageApproximation:
             f"[SAA] ID experiment {self.id_experiment} - Evaluate model for instance \n {instances_evaluation}"
         )
         solutions_evaluation: List[Dict[str, float]] = []
+        # the evaluation instance is the same for every candidate solution,
+        # so build the evaluation solver once outside the loop
+        bc_evaluation: Branch_and_Cut = self.__create_branch_and_cut(
+            instances_evaluation
+        )
         for i, solution in enumerate(best_solutions):
-            bc_evaluation: Branch_and_Cut = self.__create_branch_and_cut(
-                instances_evaluation
-            )
             current_solution["objective_value"] = bc_evaluation.solve_evaluation(
                 solution
             )
@@ -25,34 +25,49 @@ class SubProblem:
 
         # params from scenario
         self.pixels: Dict[str, Pixel] = scenario.pixels
-        self.costs_serving: Dict[str, Dict] = scenario.get_cost_serving()
-        self.fleet_size_required: Dict[str, Any] = scenario.get_fleet_size_required()
+        self.costs_serving: Dict[str, Dict] = scenario.costs
+        self.fleet_size_required: Dict[str, Any] = scenario.fleet_size_required
 
-        # Create model
-        self.model = None
+        # Create model once: variables, objective and constraints are
+        # independent of the fixed y, which enters in solve_model through
+        # variable bounds and constraint right-hand sides, so repeated
+        # solves reuse the built model and warm-start from the last basis
+        self.model = gp.Model(name="SubProblem")
 
         # Variables
         self.Z = {}
         self.X = {}
         self.W = {}
 
+        # Constraints whose right-hand side is fixed per solve
+        self.capacity_constraints = {}
+
         # Objective
         self.objective = None
         self.cost_operating_satellites = None
         self.cost_served_from_satellite = None
         self.cost_served_from_dc = None
 
+        self.__build_model()
+
+    def __build_model(self) -> None:
+        """Build variables, objective and constraints of the model."""
+        logger.info("[SP] Model created")
+        self.__add_variables(self.satellites, self.pixels)
+        self.__add_objective(self.satellites, self.pixels, self.costs_serving)
+        self.__add_constraints(self.satellites, self.pixels)
+        self.model.update()
+
     def __add_variables(
         self,
         satellites: Dict[str, Satellite],
         pixels: Dict[str, Pixel],
-        fixed_y: Dict,
     ) -> None:
         """Add variables to the model."""
         # 1. add variable Z: binary variable to decide if a satellite is operating
-        if (
-            self.type_of_flexibility == 2
-        ):  # only create variables for the capacity that is installed
+        if self.type_of_flexibility == 2:
+            # variables exist for every capacity; the fixed y closes the
+            # ones it does not allow through their upper bounds
             self.Z = dict(
                 [
                     (
@@ -63,9 +78,7 @@ class SubProblem:
                     )
                     for s, satellite in satellites.items()
                     for t in range(self.periods)
-                    for q in satellite.capacity.keys()
                     for q_lower in satellite.capacity.keys()
-                    if fixed_y[(s, q)] > 0.5 and q >= q_lower
                 ]
             )
         logger.info(f"[SP] Number of variables Z: {len(self.Z)}")
@@ -88,8 +101,7 @@ class SubProblem:
                 )
                 for t in range(self.periods)
                 for k in pixels.keys()
-                for s, satellite in satellites.items()
-                if any(fixed_y[(s, q)] > 0.5 for q in satellite.capacity.keys())
+                for s in satellites.keys()
             ]
         )
         logger.info(f"[SP] Number of variables X: {len(self.X)}")
@@ -124,7 +136,6 @@ class SubProblem:
                     for t in range(self.periods)
                     for s, satellite in satellites.items()
                     for q in satellite.capacity.keys()
-                    if (s, q, t) in self.Z.keys()
                 ]
             )
 
@@ -135,7 +146,6 @@ class SubProblem:
                 for t in range(self.periods)
                 for s in satellites.keys()
                 for k in pixels.keys()
-                if (s, k, t) in self.X.keys()
             ]
         )
 
@@ -156,82 +166,97 @@ class SubProblem:
         self.model.setObjective(self.objective, GRB.MINIMIZE)
 
     def __add_constraints(
-        self, satellites: Dict[str, Satellite], pixels: Dict[str, Pixel], fixed_y: Dict
+        self, satellites: Dict[str, Satellite], pixels: Dict[str, Pixel]
     ) -> None:
         """Add constraints to the model."""
         if self.type_of_flexibility == 1:
-            # (5) capacity constraint
+            # (5) capacity constraint: the right-hand side is the
+            # installed capacity, moved in per solve
             for t in range(self.periods):
                 for s, satellite in satellites.items():
                     nameConstraint = f"R_capacity_s{s}_t{t}"
-                    for q, capacity in satellite.capacity.items():
-                        if fixed_y[(s, q)] > 0.5:
-                            self.model.addConstr(
-                                quicksum(
-                                    [
-                                        self.X[(s, k, t)]
-                                        * self.fleet_size_required["satellite"][
-                                            (s, k, t)
-                                        ]["fleet_size"]
-                                        for k in pixels.keys()
-                                    ]
-                                )
-                                <= capacity,
-                                name=nameConstraint,
-                            )
+                    self.capacity_constraints[(s, t)] = self.model.addConstr(
+                        quicksum(
+                            [
+                                self.X[(s, k, t)]
+                                * self.fleet_size_required["satellite"][(s, k, t)][
+                                    "fleet_size"
+                                ]
+                                for k in pixels.keys()
+                            ]
+                        )
+                        <= 0.0,
+                        name=nameConstraint,
+                    )
         else:
             # (5) capacity constraint
             for t in range(self.periods):
                 for s, satellite in self.satellites.items():
-                    if any(fixed_y[(s, q)] > 0.5 for q in satellite.capacity.keys()):
-                        nameConstraint = f"R_capacity_s{s}_t{t}"
-                        self.model.addConstr(
-                            quicksum(
-                                [
-                                    self.X[(s, k, t)]
-                                    * self.fleet_size_required["satellite"][(s, k, t)][
-                                        "fleet_size"
-                                    ]
-                                    for k in self.pixels.keys()
-                                ]
-                            )
-                            - quicksum(
-                                [
-                                    self.Z[(s, q, t)] * capacity
-                                    for q, capacity in satellite.capacity.items()
-                                    if (s, q, t) in self.Z.keys()
+                    nameConstraint = f"R_capacity_s{s}_t{t}"
+                    self.model.addConstr(
+                        quicksum(
+                            [
+                                self.X[(s, k, t)]
+                                * self.fleet_size_required["satellite"][(s, k, t)][
+                                    "fleet_size"
                                 ]
-                            )
-                            <= 0,
-                            name=nameConstraint,
+                                for k in self.pixels.keys()
+                            ]
+                        )
+                        - quicksum(
+                            [
+                                self.Z[(s, q, t)] * capacity
+                                for q, capacity in satellite.capacity.items()
+                            ]
                         )
+                        <= 0,
+                        name=nameConstraint,
+                    )
 
         # (6) demand satisfied
         for t in range(self.periods):
             for k in self.pixels.keys():
                 nameConstraint = f"R_demand_k{k}_t{t}"
                 self.model.addConstr(
-                    quicksum(
-                        [
-                            self.X[(s, k, t)]
-                            for s in self.satellites.keys()
-                            if (s, k, t) in self.X.keys()
-                        ]
-                    )
+                    quicksum([self.X[(s, k, t)] for s in self.satellites.keys()])
                     + quicksum([self.W[(k, t)]])
                     == 1,
                     name=nameConstraint,
                 )
 
+    def __fix_solution(self, fixed_y: Dict[Any, float]) -> None:
+        """Translate the fixed y into variable bounds and capacities."""
+        for s, satellite in self.satellites.items():
+            is_open = any(fixed_y[(s, q)] > 0.5 for q in satellite.capacity.keys())
+            x_upper = 1.0 if is_open else 0.0
+            for t in range(self.periods):
+                for k in self.pixels.keys():
+                    self.X[(s, k, t)].UB = x_upper
+            if self.type_of_flexibility == 1:
+                installed = [
+                    capacity
+                    for q, capacity in satellite.capacity.items()
+                    if fixed_y[(s, q)] > 0.5
+                ]
+                rhs = min(installed) if installed else 0.0
+                for t in range(self.periods):
+                    self.capacity_constraints[(s, t)].RHS = rhs
+            else:
+                for q_lower in satellite.capacity.keys():
+                    z_upper = (
+                        1.0
+                        if any(
+                            fixed_y[(s, q)] > 0.5 and q >= q_lower
+                            for q in satellite.capacity.keys()
+                        )
+                        else 0.0
+                    )
+                    for t in range(self.periods):
+                        self.Z[(s, q_lower, t)].UB = z_upper
+
     def solve_model(self, fixed_y: Dict[Any, float], final_solution: bool) -> None:
         """Solve the model of the sub problem considering the fixed y."""
-        # Create model
-        self.model = gp.Model(name="SubProblem")
-
-        logger.info("[SP] Model created")
-        self.__add_variables(self.satellites, self.pixels, fixed_y)
-        self.__add_objective(self.satellites, self.pixels, self.costs_serving)
-        self.__add_constraints(self.satellites, self.pixels, fixed_y)
+        self.__fix_solution(fixed_y)
 
         # adding operational costs only for case type of flexibility 1
         cost_operating_satellites = np.sum(
@@ -249,6 +274,9 @@ class SubProblem:
             self.model._total_cost = self.objective
             self.model.update()
             self.model.Params.LogToConsole = 0
+            # subproblems run concurrently in the callback: one solver
+            # thread each avoids oversubscribing the machine
+            self.model.Params.Threads = 1
 
             start_time = time.time()
             self.model.optimize()
@@ -258,7 +286,8 @@ class SubProblem:
             logger.info(
                 f"[SUBPROBLEM] Sub problem solved - Run time: {run_time} - Total cost: {total_cost}"
             )
-            self.model.dispose()
+            # the model is kept alive: the next solve only moves the
+            # bounds and warm-starts from the basis left here
 
             return run_time, total_cost
 
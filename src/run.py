@@ -1,9 +1,25 @@
 """Main module for the SAA application."""
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 from src.app.main_local import Main
 from src.instance.experiment import Experiment
+from src.instance.instance import Instance
 from src.utils import LOGGER as logger
+from src.utils import configure_logging
+
+configure_logging()
+
+
+def solve_instance(folder_path: str, run_time: int, instance: Instance) -> None:
+    """Solve a single instance in a worker process."""
+    try:
+        Main(folder_path).solve(instance, run_time=run_time)
+    except:
+        print("Error")
+
 
 if __name__ == "__main__":
     # (1) Generate instance:
@@ -17,33 +33,20 @@ if __name__ == "__main__":
         N_evaluation=0, M=10, folder_path=FOLDER_PATH
     ).generate_instances(include_expected=True)
 
-    # (2) select cluster into supercloud
-    main = Main(FOLDER_PATH)
-
-    # (3) Get the pointers to the subset of instances to solve
+    # (2) Get the pointers to the subset of instances to solve
     my_task_id = int(sys.argv[1])
     num_tasks = int(sys.argv[2])
 
-    # (4) Get subset of instances to be solved:
+    # (3) Get subset of instances to be solved:
     instances_to_solve = instance_list[my_task_id : len(instance_list) : num_tasks]
 
-    # (4) Solve the instances:
-    for experiment in instances_to_solve:
-        for instance_train in experiment["instances_train"].values():
-            try:
-                main.solve(instance_train, run_time=3600)
-            except:
-                print("Error")
-
-    # # (3) Get subset of instances to be solved:
-    # instances_to_solve = instance_list
-    # print(f"Total experiments: {len(instances_to_solve)}")
-
-    # # (4) Solve the instances:
-    # for experiment in instances_to_solve:
-    #     for instance in experiment["instances_train"].values():
-    #         try:
-    #             print(instance.get_info())
-    #             #main.solve(instance, run_time=3600)
-    #         except:
-    #             print("Error")
+    # (4) Solve the instances in parallel, one worker process per instance.
+    # Each solver is capped to 2 threads in Main.solve so that
+    # N workers x 2 threads does not oversubscribe the node.
+    instances = [
+        instance_train
+        for experiment in instances_to_solve
+        for instance_train in experiment["instances_train"].values()
+    ]
+    with ProcessPoolExecutor(max_workers=max(1, os.cpu_count() // 2)) as executor:
+        list(executor.map(partial(solve_instance, FOLDER_PATH, 3600), instances))
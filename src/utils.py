@@ -2,7 +2,35 @@
 import logging
 
 LOGGER = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
-# logging.disable(logging.CRITICAL)
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure the root logger for the entry points.
+
+    Called from the main scripts instead of running at import time, so
+    importing src.* modules has no logging side effects.
+    """
+    logging.basicConfig(
+        level=level, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    # the format does not use thread/process info, so skip collecting it per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # logging.disable(logging.CRITICAL)
+
+
+class QuietLogging:
+    """Context manager that silences logging during a solve.
+
+    Unlike toggling `logger.disabled` by hand, the previous state is
+    restored even if the solve raises.
+    """
+
+    def __enter__(self):
+        self._previous = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+        return self
+
+    def __exit__(self, *args):
+        logging.disable(self._previous)